@@ -3,828 +3,656 @@
 """
 Remote Advanced File Browser
 A comprehensive HTTP server for browsing, filtering, and downloading files
+
+Kept to a single stdlib-only file so it can be copied to a remote host
+and run as is. The listing work is string building and dict lookups,
+which numeric JITs such as Numba can't compile; speedups here come from
+import-time templates and caches instead.
 """
 
 import http.server
-import socketserver
 import os
+import re
 import sys
 import json
-from urllib.parse import unquote, urlparse, quote
-import mimetypes
+import gzip
+import stat
+import zlib
+from collections import OrderedDict
+from urllib.parse import unquote, urlparse, quote, parse_qs, urlencode
 import time
-from collections import defaultdict
+import email.utils
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
+from pathlib import PurePosixPath
+from types import MappingProxyType
 import platform
 import socket
-import subprocess
 import uuid
 import datetime
 import threading
+import queue
 import hashlib
+import html
+import heapq
+import logging
+import logging.handlers
+from http import HTTPStatus
 from http.server import ThreadingHTTPServer
 
-class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
-    """Enhanced HTTP handler with complete navigation and file information"""
+log = logging.getLogger('remote_file_server')
+
+# Reported when the machine UUID can't be read; generated once so it stays
+# stable for the life of the process
+_FALLBACK_SYSTEM_UUID = str(uuid.uuid4())
+
+# Part of every listing ETag, so pages browsers cached from an earlier run
+# (possibly with other templates) are sent again in full after a restart
+_PAGE_EPOCH = uuid.uuid4().hex[:8]
+
+# Seconds the system information panel is reused between listings
+_SYS_INFO_TTL = 3.0
+
+# Listings with at most this many entries are rendered in full and sent
+# with a Content-Length; larger ones are streamed section by section
+_STREAM_THRESHOLD = 2000
+
+# Categories past the first two with more entries than this are sent as
+# collapsed stubs and fetched (?section=<category>) when first opened;
+# smaller ones cost less inline than the extra round trip
+_LAZY_SECTION_MIN = 50
+
+# Streamed listing sections are batched until at least this many bytes
+# are pending, then sent with one write
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Video container types the browser needs to recognise for playback
+_VIDEO_MIME_TYPES = {
+    '.mp4': 'video/mp4', '.m4v': 'video/mp4',
+    '.webm': 'video/webm',
+    '.ogv': 'video/ogg',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.wmv': 'video/x-ms-wmv',
+    '.flv': 'video/x-flv',
+    '.mkv': 'video/x-matroska',
+    '.3gp': 'video/3gpp',
+    '.mpeg': 'video/mpeg', '.mpg': 'video/mpeg',
+}
+
+# Content-Type for served files by extension, consulted before the
+# mimetypes guess; text types carry an explicit charset
+_CONTENT_TYPES = MappingProxyType({
+    '.html': 'text/html; charset=utf-8', '.htm': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.ogg': 'video/ogg',
+    **_VIDEO_MIME_TYPES,
+})
+
+# Responses for these are left cacheable even without a validator
+_VIDEO_EXTS = frozenset(_VIDEO_MIME_TYPES) | {'.ogg'}
+
+# Listing cards: videos get the hover preview row, images a thumbnail
+_PREVIEW_VIDEO_EXTS = frozenset(_VIDEO_MIME_TYPES)
+_IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.ico', '.svg'})
+
+
+def _file_ext(name):
+    """Return the lowercased extension of a file name ('' if none)
+
+    Only the suffix is lowercased, so the full name is never copied.
+    Leading dots (hidden files) are not treated as an extension.
+    """
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+
+def _query_int(query, name, default, minimum=0):
+    """Read an integer of at least minimum from parsed query parameters"""
+    try:
+        value = int(query[name][0])
+    except (KeyError, ValueError):
+        return default
+    return value if value >= minimum else default
+
+
+def _accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header value allows a gzip response"""
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        if name.strip().lower() not in ('gzip', 'x-gzip'):
+            continue
+        _, found, q = params.partition('q=')
+        try:
+            return not found or float(q) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _file_etag(st):
+    """Strong entity tag for a file, derived from its size and mtime"""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header value matches etag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _parse_byte_range(header, size):
+    """Parse a single 'bytes=' Range header into an inclusive (start, end)
+
+    Returns None when the header should be ignored (malformed, another
+    unit, or several ranges, which are answered with the whole file) and
+    raises ValueError when the range can't be satisfied.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, sep, last = spec.strip().partition('-')
+    first, last = first.strip(), last.strip()
+    if not sep or not (first or last) or not (first or '0').isdigit() or not (last or '0').isdigit():
+        return None
     
-    video_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.mpeg', '.mpg', '.m4v', '.3gp', '.ogv']
-    image_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp', '.ico']
+    if not first:
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("unsatisfiable range")
+        return max(size - length, 0), size - 1
     
-    def __init__(self, *args, **kwargs):
-        # Setup comprehensive MIME types
-        mimetypes.add_type('text/html', '.html')
-        mimetypes.add_type('text/html', '.htm')
-        mimetypes.add_type('text/css', '.css')
-        mimetypes.add_type('application/javascript', '.js')
-        mimetypes.add_type('application/json', '.json')
-        
-        # Video MIME types
-        for ext in self.video_extensions:
-            if ext == '.mp4' or ext == '.m4v':
-                mimetypes.add_type('video/mp4', ext)
-            elif ext == '.webm':
-                mimetypes.add_type('video/webm', ext)
-            elif ext == '.ogg' or ext == '.ogv':
-                mimetypes.add_type('video/ogg', ext)
-            elif ext == '.avi':
-                mimetypes.add_type('video/x-msvideo', ext)
-            elif ext == '.mov':
-                mimetypes.add_type('video/quicktime', ext)
-            elif ext == '.wmv':
-                mimetypes.add_type('video/x-ms-wmv', ext)
-            elif ext == '.flv':
-                mimetypes.add_type('video/x-flv', ext)
-            elif ext == '.mkv':
-                mimetypes.add_type('video/x-matroska', ext)
-            elif ext == '.3gp':
-                mimetypes.add_type('video/3gpp', ext)
-            elif ext in ['.mpeg', '.mpg']:
-                mimetypes.add_type('video/mpeg', ext)
-        
-        super().__init__(*args, **kwargs)
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise ValueError("unsatisfiable range")
+    return start, min(end, size - 1)
+
+
+@lru_cache(maxsize=8192)
+def _format_mtime(seconds):
+    """Format a modification time (whole seconds) for display
+
+    Files in a directory tend to share modification seconds, so the
+    localtime/strftime work is cached per distinct second.
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+
+@lru_cache(maxsize=256)
+def _http_date(seconds):
+    """RFC 1123 date for Date/Last-Modified headers, cached per second"""
+    return email.utils.formatdate(seconds, usegmt=True)
+
+
+@lru_cache(maxsize=8192)
+def _format_file_size(size_bytes):
+    """Convert bytes to human-readable format"""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
     
-    def do_GET(self):
-        """Handle GET requests with enhanced navigation"""
-        try:
-            # Handle API requests
-            if self.path.startswith('/api/'):
-                self.handle_api_request()
-                return
-            
-            # Handle download requests
-            if self.path.startswith('/download/'):
-                self.handle_dedicated_download()
-                return
-            
-            # Handle video play requests
-            if self.path.startswith('/play/'):
-                self.handle_video_play()
-                return
-            
-            # Parse path for navigation
-            parsed_path = urlparse(self.path)
-            path = unquote(parsed_path.path)
-            
-            # Handle directory navigation
-            if path == '/' or path.endswith('/'):
-                self.generate_enhanced_directory_listing(path)
-            else:
-                # Handle file requests
-                super().do_GET()
-                
-        except Exception as e:
-            print(f"❌ Error in do_GET: {e}")
-            try:
-                self.send_error(500, "Internal server error")
-            except:
-                pass
+    # Each unit step is 10 bits, so the unit index falls out of bit_length
+    i = min((size_bytes.bit_length() - 1) // 10, 4)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {('B', 'KB', 'MB', 'GB', 'TB')[i]}"
+
+
+# File categories with comprehensive extension mapping
+_FILE_CATEGORIES = {
+    'Python Scripts': ['.py', '.pyw', '.pyx'],
+    'Shell Scripts': ['.sh', '.bash', '.zsh', '.fish'],
+    'Log Files': ['.log', '.logs'],
+    'CSV Data': ['.csv'],
+    'JSON Files': ['.json', '.jsonl'],
+    'HTML Files': ['.html', '.htm'],
+    'Documents': ['.docx', '.doc', '.pdf', '.odt', '.rtf'],
+    'Text Files': ['.txt', '.md', '.readme'],
+    'Spreadsheets': ['.xlsx', '.xls', '.ods'],
+    'Stylesheets': ['.css', '.scss', '.sass', '.less'],
+    'JavaScript': ['.js', '.jsx', '.ts', '.tsx'],
+    'Images': ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp', '.ico'],
+    'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'],
+    'Audio': ['.mp3', '.wav', '.flac', '.ogg', '.m4a', '.wma'],
+    'Archives': ['.zip', '.tar', '.gz', '.bz2', '.xz', '.rar', '.7z'],
+    'Configuration': ['.conf', '.config', '.cfg', '.ini', '.yaml', '.yml', '.toml'],
+    'Database': ['.db', '.sqlite', '.sqlite3', '.sql'],
+    'XML Files': ['.xml', '.xsl', '.xsd'],
+    'Binary': ['.bin', '.exe', '.dll', '.so', '.deb', '.rpm'],
+    'Certificates': ['.pem', '.key', '.crt', '.cert', '.p12', '.pfx'],
+    'Data Files': ['.dat', '.data', '.dump'],
+    'Templates': ['.tpl', '.template', '.tmpl'],
+    'Backup Files': ['.bak', '.backup', '.old'],
+    'Temporary Files': ['.tmp', '.temp', '.cache'],
+    'System Files': ['.service', '.socket', '.timer'],
+    'Other Files': []
+}
+
+# Reverse of _FILE_CATEGORIES for O(1) classification; the first category
+# listing an extension wins, as with the original linear scan
+_EXT_TO_CATEGORY = {}
+for _category, _extensions in _FILE_CATEGORIES.items():
+    for _ext in _extensions:
+        _EXT_TO_CATEGORY.setdefault(_ext, _category)
+del _category, _extensions, _ext
+
+# Every category a scan can produce, in a fixed order
+_CATEGORY_NAMES = ('Directories', *_FILE_CATEGORIES)
+
+
+class FileInfo:
+    """One directory entry, with the display strings the listing needs
+
+    Instances are shared through the scan cache, so treat them as read-only.
+    """
     
-    def end_headers(self):
-        # Set proper content types and headers
-        if self.path.endswith(('.html', '.htm')):
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-        elif self.path.endswith('.css'):
-            self.send_header('Content-Type', 'text/css; charset=utf-8')
-        elif self.path.endswith('.js'):
-            self.send_header('Content-Type', 'application/javascript; charset=utf-8')
-        elif self.path.endswith('.json'):
-            self.send_header('Content-Type', 'application/json; charset=utf-8')
-        elif self.path.endswith(('.mp4', '.m4v')):
-            self.send_header('Content-Type', 'video/mp4')
-        elif self.path.endswith('.webm'):
-            self.send_header('Content-Type', 'video/webm')
-        elif self.path.endswith(('.ogg', '.ogv')):
-            self.send_header('Content-Type', 'video/ogg')
-        elif self.path.endswith('.avi'):
-            self.send_header('Content-Type', 'video/x-msvideo')
-        elif self.path.endswith('.mov'):
-            self.send_header('Content-Type', 'video/quicktime')
-        elif self.path.endswith('.wmv'):
-            self.send_header('Content-Type', 'video/x-ms-wmv')
-        elif self.path.endswith('.flv'):
-            self.send_header('Content-Type', 'video/x-flv')
-        elif self.path.endswith('.mkv'):
-            self.send_header('Content-Type', 'video/x-matroska')
-        elif self.path.endswith('.3gp'):
-            self.send_header('Content-Type', 'video/3gpp')
-        elif self.path.endswith(('.mpeg', '.mpg')):
-            self.send_header('Content-Type', 'video/mpeg')
-        
-        # Add range request support for video files
-        if self.path.endswith(('.mp4', '.webm', '.ogg', '.ogv', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.3gp', '.mpeg', '.mpg', '.m4v')):
-            self.send_header('Accept-Ranges', 'bytes')
-        
-        # Prevent aggressive caching for HTML, but allow video caching
-        if not self.path.endswith(('.mp4', '.webm', '.ogg', '.ogv', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.3gp', '.mpeg', '.mpg', '.m4v')):
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
-        
-        super().end_headers()
+    __slots__ = ('name', 'name_html', 'name_url', 'ext', 'ext_html', 'icon',
+                 'size', 'size_bytes', 'modified', 'mtime_ns', 'is_dir')
     
-    def log_message(self, format, *args):
-        """Custom logging"""
-        timestamp = time.strftime('%H:%M:%S')
-        print(f"[{timestamp}] {format % args}")
+    def __init__(self, name, ext, size_bytes, mtime_ns, is_dir):
+        self.name = name
+        self.name_html = html.escape(name)
+        self.name_url = quote(name)
+        self.ext = ext
+        self.ext_html = html.escape(ext)
+        self.icon = '📁' if is_dir else _ICON_MAP.get(ext, '📄')
+        self.size = _format_file_size(size_bytes)
+        self.size_bytes = size_bytes
+        self.modified = _format_mtime(mtime_ns // 1_000_000_000)
+        self.mtime_ns = mtime_ns
+        self.is_dir = is_dir
 
-    def find_file_by_name(self, filename):
-        """Find a file by name starting from the current directory tree"""
-        try:
-            current_dir = os.getcwd()
-            print(f"🔍 Searching for '{filename}' starting from: {current_dir}")
-            
-            # First check the current directory directly
-            direct_path = os.path.join(current_dir, filename)
-            if os.path.exists(direct_path):
-                return direct_path
-            
-            # Then search all subdirectories recursively
-            for root, dirs, files in os.walk(current_dir):
-                if filename in files:
-                    found_path = os.path.join(root, filename)
-                    return found_path
-        except Exception as e:
-            print(f"❌ Error in file search for '{filename}': {e}")
-            return None
-        
-        print(f"❌ File '{filename}' not found anywhere")
-        return None
 
-    def handle_api_request(self):
-        """Handle API requests"""
-        try:
-            if self.path == '/api/system':
-                system_info = self.get_system_info()
-                response = json.dumps(system_info, indent=2)
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(response.encode('utf-8'))))
-                self.end_headers()
-                self.wfile.write(response.encode('utf-8'))
-            else:
-                self.send_error(404, "API endpoint not found")
-        except Exception as e:
-            print(f"❌ API request error: {e}")
-            self.send_error(500, "Internal server error")
+class DirectoryScan:
+    """The categorized entries of one directory scan, with their rendered cards
 
-    def handle_dedicated_download(self):
-        """Handle dedicated download requests using file search"""
-        try:
-            # Extract filename from /download/filename
-            filename = unquote(self.path[10:])  # Remove '/download/' prefix
-            print(f"🔍 Download request for: '{filename}'")
-            
-            # Find the file using recursive search
-            file_path = self.find_file_by_name(filename)
-            
-            if not file_path or not os.path.exists(file_path):
-                print(f"❌ File not found: {filename}")
-                self.send_error(404, f"File '{filename}' not found")
-                return
-            
-            print(f"✅ Found file: {file_path}")
-            
-            # Get file info
-            file_size = os.path.getsize(file_path)
-            
-            # Send file
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/octet-stream')
-            self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
-            self.send_header('Content-Length', str(file_size))
-            self.end_headers()
-            
-            # Stream file in chunks
-            with open(file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(8192)
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
-                    
-        except Exception as e:
-            print(f"❌ Download error: {e}")
-            self.send_error(500, "Download failed")
+    categories is a tuple of (category, files) pairs, newest files first;
+    child_dirs is (name, visible entry count) per non-hidden subdirectory;
+    totals is (file count, directory count, total file size in bytes).
+    fingerprint changes whenever anything a listing shows does, and
+    gzipped holds compressed listing bodies keyed by the handler.
+    Scans are shared through the scan cache, so treat them as read-only.
+    """
+    
+    __slots__ = ('categories', 'child_dirs', 'totals', 'fingerprint', 'gzipped',
+                 '_category_ids', '_cards')
+    
+    def __init__(self, categories, child_dirs, totals):
+        self.categories = categories
+        self.child_dirs = child_dirs
+        self.totals = totals
+        
+        # Hash what the listing shows rather than when it was scanned, so
+        # a rescan of an unchanged directory keeps the same fingerprint
+        digest = hashlib.sha1(repr(child_dirs).encode('utf-8'))
+        for category, files in categories:
+            digest.update(category.encode('utf-8'))
+            digest.update(''.join([f'{f.name}\0{f.size_bytes}\0{f.mtime_ns}\n' for f in files])
+                          .encode('utf-8', 'surrogateescape'))
+        self.fingerprint = digest.hexdigest()[:16]
+        self.gzipped = {}
+        
+        # The category tuples live as long as the scan, so their ids are
+        # stable keys; slices of a category get fresh ids and aren't cached
+        self._category_ids = frozenset(id(files) for _, files in categories)
+        self._cards = {}
+    
+    def cards_html(self, files):
+        """Render the cards of files, a whole category or a slice of one
 
-    def handle_video_play(self):
-        """Handle video play requests"""
-        try:
-            # Extract filename from /play/filename
-            filename = unquote(self.path[6:])  # Remove '/play/' prefix
-            print(f"🎥 Video play request for: '{filename}'")
-            
-            # Find the file using recursive search
-            file_path = self.find_file_by_name(filename)
-            
-            if not file_path or not os.path.exists(file_path):
-                print(f"❌ Video file not found: {filename}")
-                self.send_error(404, f"Video '{filename}' not found")
-                return
-            
-            print(f"✅ Found video: {file_path}")
-            
-            # Serve the video file
-            super().do_GET()
-                    
-        except Exception as e:
-            print(f"❌ Video play error: {e}")
-            self.send_error(500, "Video play failed")
+        Whole categories are rendered once per scan and the HTML is
+        dropped together with the scan.
+        """
+        key = id(files)
+        if key not in self._category_ids:
+            return _render_files_html(files)
+        cards = self._cards.get(key)
+        if cards is None:
+            cards = self._cards[key] = _render_files_html(files)
+        return cards
 
-    def generate_enhanced_directory_listing(self, path):
-        """Generate enhanced directory listing"""
-        try:
-            # Use the existing list_directory method
-            return self.list_directory('.' if path == '/' else path.lstrip('/'))
-        except Exception as e:
-            print(f"❌ Directory listing error: {e}")
-            self.send_error(500, "Directory listing failed")
-    
-    def get_file_category_and_extensions(self):
-        """Define file categories with comprehensive extension mapping"""
-        return {
-            'Python Scripts': ['.py', '.pyw', '.pyx'],
-            'Shell Scripts': ['.sh', '.bash', '.zsh', '.fish'],
-            'Log Files': ['.log', '.logs'],
-            'CSV Data': ['.csv'],
-            'JSON Files': ['.json', '.jsonl'],
-            'HTML Files': ['.html', '.htm'],
-            'Documents': ['.docx', '.doc', '.pdf', '.odt', '.rtf'],
-            'Text Files': ['.txt', '.md', '.readme'],
-            'Spreadsheets': ['.xlsx', '.xls', '.ods'],
-            'Stylesheets': ['.css', '.scss', '.sass', '.less'],
-            'JavaScript': ['.js', '.jsx', '.ts', '.tsx'],
-            'Images': ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp', '.ico'],
-            'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'],
-            'Audio': ['.mp3', '.wav', '.flac', '.ogg', '.m4a', '.wma'],
-            'Archives': ['.zip', '.tar', '.gz', '.bz2', '.xz', '.rar', '.7z'],
-            'Configuration': ['.conf', '.config', '.cfg', '.ini', '.yaml', '.yml', '.toml'],
-            'Database': ['.db', '.sqlite', '.sqlite3', '.sql'],
-            'XML Files': ['.xml', '.xsl', '.xsd'],
-            'Binary': ['.bin', '.exe', '.dll', '.so', '.deb', '.rpm'],
-            'Certificates': ['.pem', '.key', '.crt', '.cert', '.p12', '.pfx'],
-            'Data Files': ['.dat', '.data', '.dump'],
-            'Templates': ['.tpl', '.template', '.tmpl'],
-            'Backup Files': ['.bak', '.backup', '.old'],
-            'Temporary Files': ['.tmp', '.temp', '.cache'],
-            'System Files': ['.service', '.socket', '.timer'],
-            'Other Files': []
-        }
+
+# Seconds a cached directory scan stays valid. The directory's own mtime
+# catches added, removed and renamed entries, but rewriting an existing
+# file doesn't touch it, so sizes and dates are refreshed on this timer.
+_SCAN_TTL = 5
+
+# Directories whose latest scan is kept. A scan of a large directory holds
+# megabytes of FileInfo objects, so there is one entry per path, replaced
+# when it goes stale, with the least recently listed paths evicted.
+_SCAN_CACHE_SIZE = 64
+_scan_cache = OrderedDict()  # path -> (mtime_ns, scanned_at, DirectoryScan)
+_scan_cache_lock = threading.Lock()
+
+
+def _scan_directory(path):
+    """Return the DirectoryScan of path
+
+    The latest scan of each path is reused while the directory mtime is
+    unchanged and it is younger than _SCAN_TTL, so reloading a browser
+    page skips the per-entry stat calls. Raises OSError if path can't be
+    listed.
+    """
+    path = os.path.abspath(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    now = time.monotonic()
+    with _scan_cache_lock:
+        cached = _scan_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns and now - cached[1] < _SCAN_TTL:
+            _scan_cache.move_to_end(path)
+            return cached[2]
     
-    def format_file_size(self, size_bytes):
-        """Convert bytes to human-readable format"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(size_bytes)
-        
-        while size >= 1024.0 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
-        
-        if i == 0:
-            return f"{int(size)} {size_names[i]}"
-        else:
-            return f"{size:.1f} {size_names[i]}"
+    # Scan outside the lock; two requests racing on a stale entry both
+    # scan and the later one is kept
+    result = _scan_directory_uncached(path)
+    with _scan_cache_lock:
+        _scan_cache[path] = (mtime_ns, now, result)
+        _scan_cache.move_to_end(path)
+        while len(_scan_cache) > _SCAN_CACHE_SIZE:
+            _scan_cache.popitem(last=False)
+    return result
+
+
+def _scan_directory_uncached(path):
+    """Scan behind _scan_directory; the results are shared, don't mutate them"""
+    # The category set is fixed, so every list exists before the loop and
+    # empty ones are dropped at the end
+    categorized_files = {category: [] for category in _CATEGORY_NAMES}
+    child_names = []
+    total_size = 0
+    # Bound once: these run for every entry
+    category_of = _EXT_TO_CATEGORY.get
     
-    def get_system_info(self):
-        """Gather comprehensive Linux system information"""
-        system_info = {}
-        
-        try:
-            # Basic system information
-            system_info['hostname'] = socket.gethostname()
-            system_info['fqdn'] = socket.getfqdn()
-            system_info['platform'] = platform.system()
-            system_info['machine'] = platform.machine()
-            system_info['processor'] = platform.processor()
-            system_info['architecture'] = platform.architecture()[0]
-            
-            # Operating system details
-            try:
-                # Try to get detailed OS info from /etc/os-release
-                with open('/etc/os-release', 'r') as f:
-                    os_release = {}
-                    for line in f:
-                        if '=' in line:
-                            key, value = line.strip().split('=', 1)
-                            os_release[key] = value.strip('"')
-                    
-                    system_info['os_name'] = os_release.get('PRETTY_NAME', platform.system())
-                    system_info['os_id'] = os_release.get('ID', 'unknown')
-                    system_info['os_version'] = os_release.get('VERSION', 'unknown')
-                    system_info['os_version_id'] = os_release.get('VERSION_ID', 'unknown')
-            except:
-                system_info['os_name'] = platform.system()
-                system_info['os_id'] = 'unknown'
-                system_info['os_version'] = platform.release()
-                system_info['os_version_id'] = 'unknown'
-            
-            # Kernel information
-            system_info['kernel_name'] = platform.system()
-            system_info['kernel_release'] = platform.release()
-            system_info['kernel_version'] = platform.version()
-            
-            # Network information
-            try:
-                # Get primary IP address
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                system_info['ip_address'] = s.getsockname()[0]
-                s.close()
-            except:
-                system_info['ip_address'] = 'unavailable'
-            
-            # MAC address
-            try:
-                mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
-                               for elements in range(0,2*6,2)][::-1])
-                system_info['mac_address'] = mac
-            except:
-                system_info['mac_address'] = 'unavailable'
+    # Process files. DirEntry caches the d_type from the directory read, so
+    # is_dir() is free and stat() is the only syscall per entry.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
             
-            # System UUID
             try:
-                result = subprocess.run(['dmidecode', '-s', 'system-uuid'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    system_info['system_uuid'] = result.stdout.strip()
+                st = entry.stat()
+                is_dir = entry.is_dir()
+                
+                # Categorize files
+                if is_dir:
+                    category = 'Directories'
+                    ext = ''
+                    if not name.startswith('.'):
+                        child_names.append(name)
                 else:
-                    system_info['system_uuid'] = str(uuid.uuid4())
-            except:
-                system_info['system_uuid'] = str(uuid.uuid4())
-            
-            # Boot time and uptime
-            try:
-                with open('/proc/uptime', 'r') as f:
-                    uptime_seconds = float(f.readline().split()[0])
-                    uptime_str = str(datetime.timedelta(seconds=int(uptime_seconds)))
-                    system_info['uptime'] = uptime_str
-                    
-                    boot_time = datetime.datetime.now() - datetime.timedelta(seconds=uptime_seconds)
-                    system_info['boot_time'] = boot_time.strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                system_info['uptime'] = 'unavailable'
-                system_info['boot_time'] = 'unavailable'
-            
-            # Memory information
-            try:
-                with open('/proc/meminfo', 'r') as f:
-                    meminfo = {}
-                    for line in f:
-                        parts = line.split(':')
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip().split()[0]
-                            meminfo[key] = int(value) * 1024  # Convert from KB to bytes
-                    
-                    total_mem = meminfo.get('MemTotal', 0)
-                    available_mem = meminfo.get('MemAvailable', 0)
-                    system_info['memory_total'] = self.format_file_size(total_mem)
-                    system_info['memory_available'] = self.format_file_size(available_mem)
-                    system_info['memory_used'] = self.format_file_size(total_mem - available_mem)
-            except:
-                system_info['memory_total'] = 'unavailable'
-                system_info['memory_available'] = 'unavailable'
-                system_info['memory_used'] = 'unavailable'
-            
-            # Enhanced CPU information
-            try:
-                with open('/proc/cpuinfo', 'r') as f:
-                    cpu_info = {}
-                    processors = []
-                    current_proc = {}
-                    
-                    for line in f:
-                        if line.strip() == '':
-                            if current_proc:
-                                processors.append(current_proc)
-                                current_proc = {}
-                        elif ':' in line:
-                            key, value = line.split(':', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            current_proc[key] = value
-                    
-                    if current_proc:
-                        processors.append(current_proc)
-                    
-                    # Get CPU details
-                    system_info['cpu_count'] = len(processors)
-                    system_info['cpu_model'] = processors[0].get('model name', 'unknown') if processors else 'unknown'
-                    system_info['cpu_cores'] = processors[0].get('cpu cores', 'unknown') if processors else 'unknown' 
-                    system_info['cpu_threads'] = len(processors)
-                    system_info['cpu_cache_size'] = processors[0].get('cache size', 'unknown') if processors else 'unknown'
-                    system_info['cpu_flags'] = processors[0].get('flags', 'unknown')[:100] + '...' if processors and processors[0].get('flags') else 'unknown'
-            except:
-                system_info['cpu_count'] = 'unavailable'
-                system_info['cpu_model'] = 'unavailable'
-                system_info['cpu_cores'] = 'unavailable'
-                system_info['cpu_threads'] = 'unavailable'
-                system_info['cpu_cache_size'] = 'unavailable'
-                system_info['cpu_flags'] = 'unavailable'
-            
-            # Load average
-            try:
-                with open('/proc/loadavg', 'r') as f:
-                    loadavg = f.readline().strip().split()[:3]
-                    system_info['load_average'] = f"{loadavg[0]} {loadavg[1]} {loadavg[2]}"
-            except:
-                system_info['load_average'] = 'unavailable'
-            
-            # Current time
-            system_info['current_time'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')
-            
-        except Exception as e:
-            print(f"Error gathering system info: {e}")
-        
-        return system_info
+                    ext = _file_ext(name)
+                    category = category_of(ext, 'Other Files')
+                
+                categorized_files[category].append(
+                    FileInfo(name, ext, st.st_size, st.st_mtime_ns, is_dir))
+                if not is_dir:
+                    total_size += st.st_size
+                
+            except (OSError, ValueError):
+                continue
     
-    def generate_system_info_html(self):
-        """Generate system information HTML section with ENDS styling"""
-        system_info = self.get_system_info()
-        
-        html = f"""
-        <div class="category-section" style="border-left-color: #e91e63; margin-bottom: 20px;">
-            <div class="category-header" style="border-left-color: #e91e63; background: linear-gradient(135deg, #1a202c 0%, #2d3748 100%);">
-                <span>🖥️ System Information</span>
+    # Sort files within categories by modification time (newest first)
+    result = []
+    for category, files in categorized_files.items():
+        if not files:
+            continue
+        files.sort(key=attrgetter('mtime_ns'), reverse=True)
+        result.append((category, tuple(files)))
+    
+    total_dirs = len(categorized_files['Directories'])
+    total_files = sum(map(len, categorized_files.values())) - total_dirs
+    # Entry counts for the navigation panel; they are refreshed with the
+    # scan, like sizes and dates
+    child_dirs = tuple((name, _count_visible_entries(os.path.join(path, name)))
+                       for name in child_names)
+    return DirectoryScan(tuple(result), child_dirs, (total_files, total_dirs, total_size))
+
+
+def _count_visible_entries(path):
+    """Number of non-hidden entries in the directory path (0 if unreadable)"""
+    try:
+        with os.scandir(path) as entries:
+            return sum(1 for entry in entries if not entry.name.startswith('.'))
+    except OSError:
+        return 0
+
+
+# Listing markup, compiled once at import and filled per item with str.format
+_NAV_SECTION_OPEN = '''
+        <div class="category-section" style="border-left-color: #4fc3f7;">
+            <div class="category-header" style="border-left-color: #4fc3f7;">
+                <span>🧭 Directory Navigation</span>
             </div>
-            <div class="category-content active">
-                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 16px; margin-bottom: 16px;">
-                    
-                    <!-- Operating System Info -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #e91e63; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>🐧</span> Operating System
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Distribution:</span>
-                            <span style="color: #e6e6e6; font-weight: 500;">{system_info.get('os_name', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Version:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('os_version', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">ID:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('os_id', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Architecture:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('architecture', 'Unknown')}</span>
+            <div class="category-content">
+                <div class="file-grid">
+'''
+
+_NAV_PARENT_ITEM = '''
+                    <div class="file-item" data-filename="parent" data-extension="">
+                        <div class="file-header">
+                            <span class="file-icon">📁</span>
+                            <div class="file-name">⬆️ {parent_name} (Parent Directory)</div>
                         </div>
-                    </div>
-                    
-                    <!-- Kernel Info -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #4fc3f7; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>⚙️</span> Kernel
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Name:</span>
-                            <span style="color: #e6e6e6; font-weight: 500;">{system_info.get('kernel_name', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Release:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('kernel_release', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Version:</span>
-                            <span style="color: #e6e6e6; font-size: 0.8em;">{system_info.get('kernel_version', 'Unknown')[:60]}{'...' if len(system_info.get('kernel_version', '')) > 60 else ''}</span>
+                        <div class="file-actions">
+                            <a href="../" class="action-btn view-btn">Go Up</a>
                         </div>
-                    </div>
-                    
-                    <!-- Network Info -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #81c784; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>🌐</span> Network
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Hostname:</span>
-                            <span style="color: #e6e6e6; font-weight: 500;">{system_info.get('hostname', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">FQDN:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('fqdn', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">IP Address:</span>
-                            <span style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{system_info.get('ip_address', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">MAC Address:</span>
-                            <span style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{system_info.get('mac_address', 'Unknown')}</span>
+                        <div class="file-details">
+                            <div class="file-info-row">
+                                <span class="file-size">Directory</span>
+                                <span>Parent</span>
+                            </div>
+                            <div class="file-path">{parent_path}</div>
                         </div>
                     </div>
-                    
-                    <!-- Enhanced CPU Info -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #ff8a65; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>🔧</span> CPU Details
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Model:</span>
-                            <span style="color: #e6e6e6; font-weight: 500; font-size: 0.8em;">{system_info.get('cpu_model', 'Unknown')[:60]}{'...' if len(system_info.get('cpu_model', '')) > 60 else ''}</span>
-                            <span style="color: #a0a0a0;">Physical Cores:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('cpu_cores', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Logical Threads:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('cpu_threads', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Cache Size:</span>
-                            <span style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{system_info.get('cpu_cache_size', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Architecture:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('machine', 'Unknown')}</span>
+'''
+
+_NAV_CURRENT_ITEM = '''
+                    <div class="file-item" data-filename="current" data-extension="" style="background: #2d3748; border: 2px solid #4fc3f7;">
+                        <div class="file-header">
+                            <span class="file-icon">📂</span>
+                            <div class="file-name">📍 {name} (Current Directory)</div>
                         </div>
-                    </div>
-                    
-                    <!-- System UUID -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #90caf9; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>🆔</span> System Identity
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Hostname:</span>
-                            <span style="color: #e6e6e6; font-weight: 500;">{system_info.get('hostname', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">FQDN:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('fqdn', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">System UUID:</span>
-                            <span style="color: #e6e6e6; font-family: monospace; font-size: 0.8em; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{system_info.get('system_uuid', 'Unknown')}</span>
+                        <div class="file-actions">
+                            <span class="action-btn" style="background: #4fc3f7; color: #000;">Current</span>
                         </div>
-                    </div>
-                    
-                    <!-- Memory Info -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #ba68c8; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>🧠</span> Memory
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Total:</span>
-                            <span style="color: #e6e6e6; font-weight: 500;">{system_info.get('memory_total', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Used:</span>
-                            <span style="color: #ff8a65;">{system_info.get('memory_used', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Available:</span>
-                            <span style="color: #81c784;">{system_info.get('memory_available', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Load Average:</span>
-                            <span style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{system_info.get('load_average', 'Unknown')}</span>
+                        <div class="file-details">
+                            <div class="file-info-row">
+                                <span class="file-size">Directory</span>
+                                <span>Current</span>
+                            </div>
+                            <div class="file-path">{path}</div>
                         </div>
                     </div>
-                    
-                    <!-- System Status -->
-                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
-                        <h4 style="color: #ffb74d; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
-                            <span>⏰</span> System Status
-                        </h4>
-                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
-                            <span style="color: #a0a0a0;">Current Time:</span>
-                            <span style="color: #e6e6e6; font-weight: 500;">{system_info.get('current_time', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Boot Time:</span>
-                            <span style="color: #e6e6e6;">{system_info.get('boot_time', 'Unknown')}</span>
-                            <span style="color: #a0a0a0;">Uptime:</span>
-                            <span style="color: #81c784; font-weight: 500;">{system_info.get('uptime', 'Unknown')}</span>
+'''
+
+_NAV_CHILD_ITEM = '''
+                    <div class="file-item" data-filename="{name_lower}" data-extension="">
+                        <div class="file-header">
+                            <span class="file-icon">📁</span>
+                            <div class="file-name">⬇️ {name}</div>
+                        </div>
+                        <div class="file-actions">
+                            <a href="{name_url}/" class="action-btn view-btn">Enter</a>
+                        </div>
+                        <div class="file-details">
+                            <div class="file-info-row">
+                                <span class="file-size">{file_count} files</span>
+                                <span>Subdirectory</span>
+                            </div>
                         </div>
                     </div>
-                    
+'''
+
+_NAV_SECTION_CLOSE = '''
                 </div>
             </div>
         </div>
-        """
-        
-        return html
-    
-    def get_absolute_display_path(self, relative_path):
-        """Convert relative HTTP path to absolute filesystem path for display"""
-        try:
-            # Get the actual absolute path where the server is running
-            server_root = os.getcwd()
-            
-            # Decode the URL path
-            decoded_path = unquote(relative_path)
-            
-            # If it's just root path, return the server root directory
-            if decoded_path == '/' or decoded_path == '':
-                return server_root
-            
-            # Otherwise, join the server root with the relative path
-            # Remove leading slash since os.path.join handles it
-            relative_part = decoded_path.lstrip('/')
-            absolute_path = os.path.join(server_root, relative_part)
-            
-            # Normalize the path to resolve any .. or . components
-            normalized_path = os.path.normpath(absolute_path)
-            
-            return normalized_path
-            
-        except Exception as e:
-            print(f"Error resolving display path: {e}")
-            # Fallback to basic path resolution
-            return os.path.abspath(unquote(relative_path) if relative_path != '/' else '.')
-    
-    def list_directory(self, path):
-        """ENDS-style directory listing with navigation and categorization"""
-        try:
-            file_list = os.listdir(path)
-        except OSError as e:
-            print(f"❌ Directory access error: {path} ({e})")
-            self.send_error(404, "No permission to list directory")
-            return None
-        except Exception as e:
-            print(f"❌ Unexpected error accessing directory: {path} ({e})")
-            self.send_error(500, "Internal server error")
-            return None
+'''
+
+_FILE_ITEM = '''
+                    <div class="file-item {item_class}" data-filename="{name_lower}" data-original-name="{name}" data-extension="{ext}" data-size-bytes="{size_bytes}" data-modified="{modified}" data-hidden="false">
+                        <div class="file-header">
+                            <span class="file-icon">{icon}</span>
+                            <div class="file-name">{name}</div>
+                        </div>
+                        {thumbnail_html}
+                        <div class="file-actions">
+                            {actions}
+                        </div>
+                        <div class="file-details">
+                            {details}
+                        </div>
+                    </div>
+                '''
+
+_CATEGORY_SECTION = '''
+                <div class="category-section">
+                    <div class="category-header">
+                        <span>{icon} {category} ({count})</span>
+                    </div>
+                    <div class="category-content"{lazy_attr}>
+                        <div class="{grid_class}">
+                            {files_html}
+                        </div>
+                    </div>
+                </div>
+            '''
+
+# Section header icon per listing category
+_CATEGORY_ICONS = MappingProxyType({
+    'Directories': '📁',
+    'Python Scripts': '🐍',
+    'Shell Scripts': '⚡',
+    'Log Files': '📋',
+    'CSV Data': '📊',
+    'JSON Files': '🔧',
+    'HTML Files': '🌐',
+    'Documents': '📄',
+    'Text Files': '📝',
+    'Spreadsheets': '📈',
+    'Stylesheets': '🎨',
+    'JavaScript': '⚡',
+    'Images': '🖼️',
+    'Videos': '🎥',
+    'Audio': '🎵',
+    'Archives': '📦',
+    'Configuration': '⚙️',
+    'Database': '🗄️',
+    'XML Files': '📋',
+    'Binary': '⚙️',
+    'Certificates': '🔐',
+    'Data Files': '💾',
+    'Templates': '📋',
+    'Backup Files': '💾',
+    'Temporary Files': '🗑️',
+    'System Files': '⚙️',
+    'Other Files': '📄'
+})
+
+# Per-file icon by extension
+_ICON_MAP = MappingProxyType({
+    '.py': '🐍', '.sh': '⚡', '.log': '📋', '.csv': '📊', '.json': '🔧',
+    '.html': '🌐', '.htm': '🌐', '.docx': '📄', '.txt': '📝', '.xlsx': '📈',
+    '.css': '🎨', '.js': '⚡', '.png': '🖼️', '.jpg': '🖼️', '.pdf': '📄',
+    '.mp4': '🎥', '.mp3': '🎵', '.zip': '📦', '.conf': '⚙️', '.sql': '🗄️'
+})
+
+# Stylesheet and behaviour script for the listing page. Plain strings, so
+# the braces need no f-string escaping.
+_BROWSER_CSS = '''
+        body {
+            font-family: 'Segoe UI', 'Monaco', 'Consolas', monospace;
+            background: linear-gradient(135deg, #0f1419 0%, #1a1f2e 100%);
+            color: #e6e6e6;
+            margin: 0;
+            padding: 20px;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1600px;
+            margin: 0 auto;
+            background: #1e2329;
+            border-radius: 12px;
+            padding: 30px;
+            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
+        }
         
-        categories = self.get_file_category_and_extensions()
-        categorized_files = defaultdict(list)
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            padding-bottom: 20px;
+            border-bottom: 2px solid #4fc3f7;
+        }
+        .header h1 {
+            color: #4fc3f7;
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+        }
+        .header p {
+            color: #aaa;
+            font-size: 1.1em;
+            margin: 0;
+        }
+        .breadcrumb {
+            background: #2d3748;
+            padding: 12px 20px;
+            border-radius: 8px;
+            font-family: monospace;
+            font-size: 14px;
+            color: #4fc3f7;
+            margin-bottom: 20px;
+            border-left: 4px solid #4fc3f7;
+        }
         
-        # Process files
-        for name in file_list:
-            fullname = os.path.join(path, name)
-            
-            try:
-                stat = os.stat(fullname)
-                file_size = stat.st_size
-                mod_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat.st_mtime))
-                
-                file_info = {
-                    'name': name,
-                    'size': self.format_file_size(file_size),
-                    'size_bytes': file_size,
-                    'modified': mod_time,
-                    'is_dir': os.path.isdir(fullname)
-                }
-                
-                # Categorize files
-                if file_info['is_dir']:
-                    categorized_files['Directories'].append(file_info)
-                else:
-                    _, ext = os.path.splitext(name.lower())
-                    categorized = False
-                    
-                    for category, extensions in categories.items():
-                        if ext in extensions:
-                            categorized_files[category].append(file_info)
-                            categorized = True
-                            break
-                    
-                    if not categorized:
-                        categorized_files['Other Files'].append(file_info)
-                        
-            except (OSError, ValueError):
-                continue
-        
-        # Sort files within categories by modification time
-        for category in categorized_files:
-            categorized_files[category].sort(key=lambda x: x['modified'], reverse=True)
-        
-        # Generate HTML
-        html_content = self.generate_ends_style_html(path, categorized_files)
-        
-        # Send response
-        try:
-            encoded = html_content.encode('utf-8')
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(encoded)))
-            self.end_headers()
-            self.wfile.write(encoded)
-        except Exception as e:
-            print(f"❌ Error sending response: {e}")
-            try:
-                self.send_error(500, "Internal server error")
-            except:
-                pass
-        return None
-    
-    def generate_ends_style_html(self, path, categorized_files):
-        """Generate HTML with ENDS styling and layout"""
-        
-        # Get absolute display path for breadcrumb
-        display_path = self.get_absolute_display_path(self.path)
-        
-        # Calculate statistics
-        total_files = sum(len(files) for category, files in categorized_files.items() if category != 'Directories')
-        total_dirs = len(categorized_files.get('Directories', []))
-        total_size = sum(f['size_bytes'] for files in categorized_files.values() for f in files if not f['is_dir'])
-        total_size_str = self.format_file_size(total_size)
-        
-        # Generate stats HTML
-        stats_html = f"""
-        <div class="stats-grid">
-            <div class="stat-item">
-                <div class="stat-number">{total_dirs}</div>
-                <div class="stat-label">Directories</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{total_files}</div>
-                <div class="stat-label">Files</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{total_size_str}</div>
-                <div class="stat-label">Total Size</div>
-            </div>
-        </div>
-"""
-        
-        # Generate system information HTML
-        system_info_html = self.generate_system_info_html()
-        
-        # Generate navigation HTML
-        navigation_html = self.generate_navigation_html(path)
-        
-        # Generate category sections
-        categories_html = self.generate_category_sections_html(categorized_files)
-        
-        html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Remote Advanced File Browser - {display_path}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', 'Monaco', 'Consolas', monospace;
-            background: linear-gradient(135deg, #0f1419 0%, #1a1f2e 100%);
-            color: #e6e6e6;
-            margin: 0;
-            padding: 20px;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-            background: #1e2329;
-            border-radius: 12px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-        }}
-        
-        .header {{
-            text-align: center;
-            margin-bottom: 30px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #4fc3f7;
-        }}
-        .header h1 {{
-            color: #4fc3f7;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }}
-        .header p {{
-            color: #aaa;
-            font-size: 1.1em;
-            margin: 0;
-        }}
-        .breadcrumb {{
-            background: #2d3748;
-            padding: 12px 20px;
-            border-radius: 8px;
-            font-family: monospace;
-            font-size: 14px;
-            color: #4fc3f7;
-            margin-bottom: 20px;
-            border-left: 4px solid #4fc3f7;
-        }}
-        
-        .stats-container {{
+        .stats-container {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             border-radius: 12px;
             padding: 25px;
             margin-bottom: 30px;
             box-shadow: 0 8px 25px rgba(0, 0, 0, 0.2);
-        }}
-        .stats-grid {{
+        }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 20px;
-        }}
-        .stat-item {{
+        }
+        .stat-item {
             text-align: center;
             color: white;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2.2em;
             font-weight: bold;
             display: block;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-size: 0.9em;
             opacity: 0.9;
             margin-top: 5px;
-        }}
+        }
         
-        .category-section {{
+        .category-section {
             background: #252932;
             border-radius: 12px;
             margin-bottom: 25px;
             overflow: hidden;
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
             border-left: 4px solid #4fc3f7;
-        }}
-        .category-header {{
+        }
+        .category-header {
             background: #2d3748;
             color: #4fc3f7;
             padding: 18px 25px;
@@ -836,57 +664,57 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             align-items: center;
             border-left: 4px solid #4fc3f7;
             transition: all 0.3s ease;
-        }}
-        .category-header:hover {{
+        }
+        .category-header:hover {
             background: #3c4556;
-        }}
-        .category-content {{
+        }
+        .category-content {
             display: none;
-        }}
-        .category-content.active {{
+        }
+        .category-content.active {
             display: block;
-        }}
+        }
         
-        .file-grid {{
+        .file-grid {
             display: flex;
             flex-direction: column;
             gap: 15px;
             padding: 20px;
-        }}
-        .file-grid.non-video {{
+        }
+        .file-grid.non-video {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-        }}
+        }
         
-        .file-item {{
+        .file-item {
             background: #1a1f2e;
             border: 1px solid #3c4556;
             border-radius: 8px;
             padding: 20px;
             transition: all 0.3s ease;
             position: relative;
-        }}
-        .file-item:hover {{
+        }
+        .file-item:hover {
             background: #252932;
             transform: translateY(-2px);
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
-        }}
-        .file-item[data-hidden="true"] {{
+        }
+        .file-item[data-hidden="true"] {
             display: none;
-        }}
+        }
         
-        .file-header {{
+        .file-header {
             display: flex;
             align-items: flex-start;
             gap: 12px;
             margin-bottom: 12px;
-        }}
-        .file-icon {{
+        }
+        .file-icon {
             font-size: 1.8em;
             min-width: 35px;
             line-height: 1;
-        }}
-        .file-name {{
+        }
+        .file-name {
             font-weight: 600;
             font-size: 1.1em;
             color: #e6e6e6;
@@ -897,15 +725,15 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             max-width: 100%;
             flex: 1;
             min-width: 0;
-        }}
+        }
         
         /* Action Buttons */
-        .file-actions {{
+        .file-actions {
             display: flex;
             gap: 8px;
             margin: 12px 0;
-        }}
-        .action-btn {{
+        }
+        .action-btn {
             padding: 8px 16px;
             border: 1px solid #4a5568;
             border-radius: 6px;
@@ -917,37 +745,37 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             transition: all 0.3s ease;
             text-align: center;
             min-width: 70px;
-        }}
-        .action-btn:hover {{
+        }
+        .action-btn:hover {
             background: #4a5568;
             color: #4fc3f7;
             text-decoration: none;
-        }}
-        .action-btn.view-btn:hover {{
+        }
+        .action-btn.view-btn:hover {
             background: #81c784;
             color: #000;
-        }}
-        .action-btn.download-btn:hover {{
+        }
+        .action-btn.download-btn:hover {
             background: #ff8a65;
             color: #000;
-        }}
+        }
         
-        .file-details {{
+        .file-details {
             margin-top: 12px;
             font-size: 0.9em;
             color: #aaa;
-        }}
-        .file-info-row {{
+        }
+        .file-info-row {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 4px;
-        }}
-        .file-size {{
+        }
+        .file-size {
             font-weight: 600;
             color: #4fc3f7;
-        }}
-        .file-path {{
+        }
+        .file-path {
             background: #1a202c;
             padding: 6px 10px;
             border-radius: 4px;
@@ -960,18 +788,18 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             overflow-wrap: break-word;
             white-space: pre-wrap;
             font-weight: 500;
-        }}
+        }
         
         /* Image Thumbnail Styles */
-        .thumbnail-container {{
+        .thumbnail-container {
             margin: 8px 0;
             text-align: center;
             background: #2d3748;
             border-radius: 4px;
             padding: 4px;
             border: 1px solid #4a5568;
-        }}
-        .thumbnail-image, .thumbnail-video {{
+        }
+        .thumbnail-image, .thumbnail-video {
             max-width: 300px;
             max-height: 240px;
             width: auto;
@@ -980,21 +808,21 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             object-fit: cover;
             background: #1a202c;
             transition: transform 0.3s ease;
-        }}
-        .thumbnail-image:hover {{
+        }
+        .thumbnail-image:hover {
             transform: scale(2.1);
             cursor: pointer;
             z-index: 10;
             position: relative;
-        }}
-        .video-static-thumb:hover {{
+        }
+        .video-static-thumb:hover {
             transform: scale(1.05);
             box-shadow: 0 4px 15px rgba(255, 107, 107, 0.4);
             background: linear-gradient(135deg, #3d4758 0%, #2a303d 100%);
-        }}
+        }
         
         /* Floating video preview overlay */
-        .video-preview-overlay {{
+        .video-preview-overlay {
             position: fixed;
             top: 50%;
             left: 50%;
@@ -1007,14 +835,14 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             z-index: 9999;
             display: none;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.8);
-        }}
+        }
         
-        .video-preview-overlay video {{
+        .video-preview-overlay video {
             width: 100%;
             height: 100%;
             border-radius: 5px;
-        }}
-        .video-overlay {{
+        }
+        .video-overlay {
             position: absolute;
             top: 50%;
             left: 50%;
@@ -1024,30 +852,312 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             text-shadow: 2px 2px 4px rgba(0,0,0,0.8);
             pointer-events: none;
             transition: opacity 0.3s ease;
-        }}
-        .thumbnail-container:hover .video-overlay {{
+        }
+        .thumbnail-container:hover .video-overlay {
             opacity: 0.7;
-        }}
-        .thumbnail-container {{
+        }
+        .thumbnail-container {
             position: relative;
-        }}
-        .has-thumbnail {{
+        }
+        .has-thumbnail {
             min-height: 300px;
-        }}
-        .has-thumbnail .file-header {{
+        }
+        .has-thumbnail .file-header {
             margin-bottom: 4px;
-        }}
+        }
         
         /* Responsive Design */
-        @media (max-width: 768px) {{
-            .file-grid {{
+        @media (max-width: 768px) {
+            .file-grid {
                 grid-template-columns: 1fr;
-            }}
-            .stats-grid {{
+            }
+            .stats-grid {
                 grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
-            }}
-        }}
-    </style>
+            }
+        }
+'''
+
+_BROWSER_JS = '''
+        // Initialize - show navigation and directories by default
+        document.querySelectorAll('.category-section').forEach((section, index) => {
+            if (index < 2) { // Show first 2 categories by default
+                section.querySelector('.category-content').classList.add('active');
+                section.querySelector('.category-header').style.transform = 'translateX(5px)';
+            }
+        });
+        
+        // All interactions are delegated from document: one listener per
+        // event type, however many files the listing has
+        function pauseAllPreviews() {
+            document.querySelectorAll('.video-preview-player').forEach(video => {
+                video.pause();
+            });
+        }
+        
+        document.addEventListener('click', function(e) {
+            const target = e.target.closest('.category-header, .thumbnail-image, .download-btn, .play-video-btn');
+            if (!target) return;
+            
+            if (target.classList.contains('category-header')) {
+                // Toggle category sections
+                const content = target.nextElementSibling;
+                if (content.classList.contains('active')) {
+                    content.classList.remove('active');
+                    target.style.transform = 'none';
+                } else {
+                    content.classList.add('active');
+                    target.style.transform = 'translateX(5px)';
+                    loadLazySection(content);
+                }
+            } else if (target.classList.contains('thumbnail-image')) {
+                // Open thumbnail images in a new tab
+                e.preventDefault();
+                window.open(target.src, '_blank');
+            } else {
+                // Download and play buttons: pause previews to free bandwidth
+                // and let the browser handle the link naturally
+                console.log('Link clicked:', target.href);
+                pauseAllPreviews();
+            }
+        });
+        
+        // Large sections arrive as empty stubs; fetch their cards once, the
+        // first time they are opened
+        function loadLazySection(content) {
+            const url = content.dataset.lazyUrl;
+            if (!url) return;
+            delete content.dataset.lazyUrl;
+            
+            fetch(url).then(response => {
+                if (!response.ok) throw new Error('HTTP ' + response.status);
+                return response.text();
+            }).then(cards => {
+                const grid = content.firstElementChild;
+                grid.innerHTML = cards;
+                grid.querySelectorAll('.video-preview-player').forEach(watchVideo);
+            }).catch(e => {
+                console.log('Loading section failed:', e);
+                content.dataset.lazyUrl = url;
+            });
+        }
+        
+        // Video hover previews. mouseenter/mouseleave don't bubble, so these
+        // use mouseover/mouseout and ignore moves within the same element;
+        // the auto-hide timer lives on the preview area's dataset.
+        function previewParts(el) {
+            const container = el.closest('.video-row-container');
+            if (!container) return null;
+            const previewArea = container.querySelector('.video-preview-area');
+            const videoPlayer = container.querySelector('.video-preview-player');
+            return previewArea && videoPlayer ? { previewArea, videoPlayer } : null;
+        }
+        
+        function hidePreview(parts) {
+            parts.previewArea.style.display = 'none';
+            parts.videoPlayer.pause();
+            clearTimeout(Number(parts.previewArea.dataset.previewTimeout));
+        }
+        
+        document.addEventListener('mouseover', function(e) {
+            const thumb = e.target.closest('.video-static-thumb');
+            if (!thumb || thumb.contains(e.relatedTarget)) return;
+            const parts = previewParts(thumb);
+            if (!parts) return;
+            
+            clearTimeout(Number(parts.previewArea.dataset.previewTimeout));
+            parts.previewArea.style.display = 'block';
+            parts.videoPlayer.currentTime = 0;
+            
+            parts.videoPlayer.play().catch(e => {
+                console.log('Video play failed:', e);
+            });
+            
+            parts.previewArea.dataset.previewTimeout = setTimeout(() => {
+                parts.previewArea.style.display = 'none';
+                parts.videoPlayer.pause();
+            }, 60000);
+        });
+        
+        document.addEventListener('mouseout', function(e) {
+            const thumb = e.target.closest('.video-static-thumb');
+            if (thumb) {
+                if (thumb.contains(e.relatedTarget)) return;
+                const parts = previewParts(thumb);
+                if (!parts) return;
+                setTimeout(() => {
+                    if (!parts.previewArea.matches(':hover')) {
+                        hidePreview(parts);
+                    }
+                }, 100);
+                return;
+            }
+            
+            const area = e.target.closest('.video-preview-area');
+            if (!area || area.contains(e.relatedTarget)) return;
+            const parts = previewParts(area);
+            if (parts) hidePreview(parts);
+        });
+        
+        function preloadVideo(video) {
+            video.dataset.preloaded = '1';
+            video.preload = 'metadata';
+            video.load();
+            
+            // Set source directly for better compatibility
+            const source = video.querySelector('source');
+            if (source && source.src) {
+                video.src = source.src;
+            }
+            
+            // Simple metadata handler
+            video.addEventListener('loadedmetadata', function() {
+                this.currentTime = 0.5;
+            }, { once: true });
+        }
+        
+        // Preload videos as they come near the viewport; ones that are
+        // never scrolled to (or sit in closed sections) are never fetched.
+        // Lazily loaded sections register their videos here too.
+        const videoObserver = 'IntersectionObserver' in window
+            ? new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    if (!entry.isIntersecting) return;
+                    videoObserver.unobserve(entry.target);
+                    preloadVideo(entry.target);
+                });
+            }, { rootMargin: '200px' })
+            : null;
+        
+        function watchVideo(video) {
+            if (videoObserver) {
+                videoObserver.observe(video);
+            } else {
+                preloadVideo(video);
+            }
+        }
+        
+        // SIMPLE video setup - no complex activation
+        function setupVideos() {
+            console.log('=== SIMPLE VIDEO SETUP ===');
+            
+            const allVideos = document.querySelectorAll('.video-preview-player');
+            console.log('Found', allVideos.length, 'videos');
+            
+            allVideos.forEach(watchVideo);
+            
+            // ONE-TIME activation on first user interaction anywhere on page
+            let activated = false;
+            const activateAllVideos = () => {
+                if (activated) return;
+                activated = true;
+                
+                console.log('=== ACTIVATING ALL VIDEOS ON FIRST INTERACTION ===');
+                
+                // One preloaded video per animation frame instead of a timer
+                // per video
+                const videos = Array.from(allVideos).filter(video => video.dataset.preloaded);
+                let index = 0;
+                const step = () => {
+                    if (index >= videos.length) return;
+                    const video = videos[index++];
+                    video.play().then(() => {
+                        video.pause();
+                        video.currentTime = 0.5;
+                    }).catch(e => {
+                        console.log('Video activation failed:', e);
+                    });
+                    requestAnimationFrame(step);
+                };
+                requestAnimationFrame(step);
+            };
+            
+            // Listen for ANY user interaction to activate videos
+            ['click', 'mousedown', 'touchstart', 'keydown'].forEach(eventType => {
+                document.addEventListener(eventType, activateAllVideos, { once: true });
+            });
+        }
+            
+        // The live system details aren't part of the page, which keeps it
+        // cacheable; fill them in from the API
+        function loadSystemInfo() {
+            const fields = document.querySelectorAll('[data-system-info]');
+            if (!fields.length) return;
+            fetch('/api/system').then(response => {
+                if (!response.ok) throw new Error('HTTP ' + response.status);
+                return response.json();
+            }).then(info => {
+                fields.forEach(field => {
+                    const value = info[field.dataset.systemInfo];
+                    field.textContent = value === undefined ? 'Unknown' : value;
+                });
+            }).catch(e => console.log('Loading system information failed:', e));
+        }
+            
+        // Simple initialization; runs once even though it is scheduled twice
+        let initialized = false;
+        function initializeEverything() {
+            if (initialized) return;
+            initialized = true;
+            loadSystemInfo();
+            setupVideos();
+        }
+        
+        // Initialize
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', initializeEverything);
+        } else {
+            initializeEverything();
+        }
+        
+        setTimeout(initializeEverything, 300);
+'''
+
+
+def _minify_css(css):
+    """Strip comments and layout whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r' ?([{};,]) ?', r'\1', css).strip()
+
+
+def _minify_js(js):
+    """Drop indentation, blank lines and whole-line // comments from a script
+
+    Line breaks are kept so automatic semicolon insertion still applies.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def _static_asset(text, content_type):
+    """Pre-encode a page asset as (body, gzipped body, content type, etag)"""
+    body = text.encode('utf-8')
+    return body, gzip.compress(body, 9), content_type, '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+
+
+# The stylesheet and script are served from their own URLs so browsers
+# cache them across listings; the ?v= tag changes whenever they do
+_STATIC_ASSETS = MappingProxyType({
+    '/__browser.css': _static_asset(_minify_css(_BROWSER_CSS), 'text/css; charset=utf-8'),
+    '/__browser.js': _static_asset(_minify_js(_BROWSER_JS), 'application/javascript; charset=utf-8'),
+})
+_CSS_BLOCK = '    <link rel="stylesheet" href="/__browser.css?v=%s">' % _STATIC_ASSETS['/__browser.css'][3].strip('"')
+_SCRIPT_BLOCK = '    <script src="/__browser.js?v=%s"></script>' % _STATIC_ASSETS['/__browser.js'][3].strip('"')
+
+
+# Listing page chrome. Only the small title and header templates are
+# filled per request with str.format; the stylesheet link is yielded
+# between them as-is, and the tail (closing markup and script) never
+# changes.
+_PAGE_TITLE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Remote Advanced File Browser - {display_path}</title>
+'''
+
+_PAGE_HEAD = '''
 </head>
 <body>
     <div class="container">
@@ -1057,485 +1167,1184 @@ class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
             <div class="breadcrumb">📁 Current Path: {display_path}</div>
         </div>
         
-        {system_info_html}
+        {system_info_html}
+        
+        <div class="stats-container">
+            {stats_html}
+        </div>
+        
+        {navigation_html}
+        
+'''
+
+_PAGE_TAIL = '''
+    </div>
+    
+''' + _SCRIPT_BLOCK + '''
+</body>
+</html>'''
+
+
+# Card templates, one per kind of entry: _FILE_ITEM with the parts that
+# only depend on the kind (thumbnail, actions, details) filled in at
+# import, so rendering a card is a single format call on per-file fields
+def _card_template(item_class='', thumbnail_html='', actions='', details=''):
+    """Pre-fill _FILE_ITEM for one kind of card, keeping the per-file slots"""
+    return _FILE_ITEM.format(
+        item_class=item_class, thumbnail_html=thumbnail_html, actions=actions, details=details,
+        name_lower='{name_lower}', name='{name}', ext='{ext}', size_bytes='{size_bytes}',
+        modified='{modified}', icon='{icon}',
+    )
+
+
+_FILE_ACTIONS = '<a href="{name_url}" class="action-btn view-btn">View</a><a href="{name_url}" download class="action-btn download-btn">Download</a>'
+
+_FILE_DETAILS = '''
+                        <div class="file-info-row">
+                            <span class="file-size">{size}</span>
+                            <span>{modified}</span>
+                        </div>'''
+
+_DIR_CARD = _card_template(
+    actions='<a href="{name_url}/" class="action-btn view-btn">Enter</a>',
+    details='''
+                        <div class="file-info-row">
+                            <span class="file-size">Directory</span>
+                            <span>Subdirectory</span>
+                        </div>''')
+
+_PLAIN_CARD = _card_template(actions=_FILE_ACTIONS, details=_FILE_DETAILS)
+
+_IMAGE_CARD = _card_template('has-thumbnail', '''
+                            <div class="thumbnail-container">
+                                <img src="{name_url}" alt="Thumbnail of {name}" class="thumbnail-image" loading="lazy" onerror="this.parentElement.style.display='none'">
+                            </div>''', _FILE_ACTIONS, _FILE_DETAILS)
+
+# Videos carry their actions in the preview row instead of the card footer
+_VIDEO_CARD = _card_template('has-thumbnail', '''
+                            <div class="video-row-container" style="display: flex; align-items: flex-start; gap: 20px; width: 100%; background: #1a1f2e; border: 1px solid #4a5568; border-radius: 8px; padding: 20px; margin-bottom: 15px;">
+                                <!-- Static Video Thumbnail -->
+                                <div class="video-static-thumb" data-video-url="{name_url}" style="width: 200px; height: 150px; background: linear-gradient(135deg, #2d3748 0%, #1a202c 100%); border: 2px solid #ff6b6b; border-radius: 4px; display: flex; flex-direction: column; align-items: center; justify-content: center; color: #ff6b6b; font-size: 1.5em; cursor: pointer; flex-shrink: 0;">
+                                    🎬
+                                    <div style="font-size: 0.4em; margin-top: 5px; color: #aaa; text-align: center;">Hover for Preview</div>
+                                </div>
+                                
+                                <!-- Video Preview Area -->
+                                <div class="video-preview-area" style="width: 300px; height: 225px; background: #000; border: 2px solid #ff6b6b; border-radius: 4px; display: none; flex-shrink: 0;">
+                                    <video class="video-preview-player" muted loop preload="metadata" style="width: 100%; height: 100%; border-radius: 2px;">
+                                        <source src="{name_url}" type="video/mp4">
+                                    </video>
+                                </div>
+                                
+                                <!-- Video Information -->
+                                <div class="video-info" style="flex: 1; color: #e6e6e6;">
+                                    <h3 style="color: #81c784; font-weight: bold; margin: 0 0 10px 0; font-size: 1.2em; word-break: break-word;">{name}</h3>
+                                    <div style="display: grid; grid-template-columns: auto 1fr; gap: 8px 15px; font-size: 0.9em; margin-bottom: 15px;">
+                                        <span style="color: #aaa;">Size:</span>
+                                        <span style="color: #4fc3f7; font-weight: 500;">{size}</span>
+                                        <span style="color: #aaa;">Modified:</span>
+                                        <span style="color: #81c784;">{modified}</span>
+                                        <span style="color: #aaa;">Type:</span>
+                                        <span style="color: #ff8a65;">Video File ({ext_upper})</span>
+                                    </div>
+                                    <div class="video-actions" style="display: flex; gap: 10px;">
+                                        <a href="{name_url}" class="action-btn play-video-btn" target="_blank" rel="noopener noreferrer" style="background: #ff6b6b; color: white; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-weight: 500; transition: background 0.3s;">▶️ Play Video</a>
+                                        <a href="{name_url}" download class="action-btn download-btn" style="background: #2d3748; color: #e6e6e6; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-weight: 500; transition: background 0.3s;">⬇️ Download</a>
+                                    </div>
+                                </div>
+                            </div>''', '', _FILE_DETAILS)
+
+_CARD_BY_EXT = MappingProxyType({
+    **dict.fromkeys(_IMAGE_EXTS, _IMAGE_CARD),
+    **dict.fromkeys(_PREVIEW_VIDEO_EXTS, _VIDEO_CARD),
+})
+
+
+def _render_file_item(file_info):
+    """Render one file or directory card"""
+    if file_info.is_dir:
+        template = _DIR_CARD
+    else:
+        template = _CARD_BY_EXT.get(file_info.ext, _PLAIN_CARD)
+    return template.format(
+        name_lower=file_info.name_html.lower(),
+        name=file_info.name_html,
+        name_url=file_info.name_url,
+        ext=file_info.ext_html,
+        ext_upper=file_info.ext_html.upper(),
+        size=file_info.size,
+        size_bytes=file_info.size_bytes,
+        modified=file_info.modified,
+        icon=file_info.icon,
+    )
+
+
+def _render_files_html(files):
+    """Render the cards of one category's files (see DirectoryScan.cards_html)"""
+    return ''.join(map(_render_file_item, files))
+
+
+class RemoteFileServerHandler(http.server.SimpleHTTPRequestHandler):
+    """Enhanced HTTP handler with complete navigation and file information"""
+    
+    # Validator for the file being served and the length of the requested
+    # byte range (None for the whole file), both set by send_head
+    etag = None
+    range_length = None
+    
+    # Cache-Control for responses served from memory (static assets and
+    # buffered listings)
+    cache_control = None
+    
+    # TCP_NODELAY: headers and small bodies go out in separate writes, which
+    # Nagle would hold back waiting for the client's delayed ACK
+    disable_nagle_algorithm = True
+    
+    # System information caches, shared by all handler instances
+    _static_system_info = None
+    _system_info_cache = None
+    
+    # Media types that get listing thumbnails (the module-level sets)
+    video_extensions = _PREVIEW_VIDEO_EXTS
+    image_extensions = _IMAGE_EXTS
+    
+    def do_GET(self):
+        """Handle GET requests with enhanced navigation"""
+        try:
+            # Listing stylesheet and script
+            if self.path.startswith('/__browser.'):
+                self.handle_static_asset()
+                return
+            
+            # Handle API requests
+            if self.path.startswith('/api/'):
+                self.handle_api_request()
+                return
+            
+            # Handle download requests
+            if self.path.startswith('/download/'):
+                self.handle_dedicated_download()
+                return
+            
+            # Handle video play requests
+            if self.path.startswith('/play/'):
+                self.handle_video_play()
+                return
+            
+            # Parse path for navigation
+            parsed_path = urlparse(self.path)
+            path = unquote(parsed_path.path)
+            
+            # Handle directory navigation
+            if path == '/' or path.endswith('/'):
+                self.generate_enhanced_directory_listing(path)
+            else:
+                # Handle file requests
+                super().do_GET()
+                
+        except Exception as e:
+            log.error("❌ Error in do_GET: %s", e)
+            try:
+                self.send_error(500, "Internal server error")
+            except OSError:
+                pass
+    
+    def send_head(self):
+        """Common code for GET and HEAD, with ETag revalidation and ranges
+
+        Answers a matching If-None-Match with 304 Not Modified and a single
+        byte range with 206 Partial Content; everything else (including
+        If-Modified-Since) is left to the base class.
+        """
+        self.etag = None
+        self.range_length = None
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+        if not stat.S_ISREG(st.st_mode):
+            return super().send_head()
+        
+        self.etag = _file_etag(st)
+        if _etag_matches(self.headers.get('If-None-Match'), self.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+            self.end_headers()
+            return None
+        
+        # Byte ranges let players seek and downloads resume. A stale If-Range
+        # validator means the client wants the whole (changed) file instead.
+        byte_range = None
+        if 'Range' in self.headers and self.if_range_matches(st):
+            try:
+                byte_range = _parse_byte_range(self.headers['Range'], st.st_size)
+            except ValueError:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header('Content-Range', f'bytes */{st.st_size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return None
+        if byte_range is None:
+            return super().send_head()
+        
+        start, end = byte_range
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        f.seek(start)
+        self.range_length = end - start + 1
+        self.send_response(HTTPStatus.PARTIAL_CONTENT)
+        self.send_header('Content-type', self.guess_type(path))
+        self.send_header('Content-Range', f'bytes {start}-{end}/{st.st_size}')
+        self.send_header('Content-Length', str(self.range_length))
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+        self.end_headers()
+        return f
+    
+    def if_range_matches(self, st):
+        """Whether a Range request still applies given its If-Range header"""
+        if_range = self.headers.get('If-Range')
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"'):
+            return if_range == self.etag
+        return if_range == self.date_time_string(st.st_mtime)
+    
+    def guess_type(self, path):
+        """Content-Type for a served file, from _CONTENT_TYPES when listed"""
+        content_type = _CONTENT_TYPES.get(os.path.splitext(path)[1].lower())
+        return content_type or super().guess_type(path)
+    
+    def end_headers(self):
+        # Files with a validator support range requests and may be stored
+        # but must be revalidated; otherwise prevent aggressive caching for
+        # HTML, but allow video caching
+        if self.cache_control is not None:
+            self.send_header('ETag', self.etag)
+            self.send_header('Cache-Control', self.cache_control)
+        elif self.etag is not None:
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_header('ETag', self.etag)
+            self.send_header('Cache-Control', 'no-cache')
+        elif _file_ext(urlparse(self.path).path) not in _VIDEO_EXTS:
+            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+            self.send_header('Pragma', 'no-cache')
+            self.send_header('Expires', '0')
+        
+        super().end_headers()
+    
+    def copyfile(self, source, outputfile):
+        """Copy file data to the client with sendfile(2) where available
+
+        socket.sendfile falls back to a plain send loop by itself when the
+        source isn't a regular file or the platform lacks os.sendfile.
+        """
+        if outputfile is not self.wfile:
+            super().copyfile(source, outputfile)
+            return
+        # Anything buffered (the headers) has to hit the socket first
+        outputfile.flush()
+        self.connection.sendfile(source, source.tell(), self.range_length)
+    
+    def date_time_string(self, timestamp=None):
+        """Return the HTTP date for timestamp (default: now) from the cache"""
+        if timestamp is None:
+            timestamp = time.time()
+        return _http_date(int(timestamp))
+    
+    def log_message(self, format, *args):
+        """Route request logging through the module logger"""
+        log.info(format, *args)
+
+    def find_file_by_name(self, filename):
+        """Find a file by name starting from the current directory tree"""
+        try:
+            current_dir = self.directory
+            log.info("🔍 Searching for '%s' starting from: %s", filename, current_dir)
+            
+            # First check the current directory directly, as long as the
+            # name doesn't climb out of it
+            direct_path = os.path.normpath(os.path.join(current_dir, filename))
+            if (os.path.commonpath((current_dir, direct_path)) == current_dir
+                    and os.path.exists(direct_path)):
+                return direct_path
+            
+            # Then search all subdirectories recursively
+            for root, dirs, files in os.walk(current_dir):
+                if filename in files:
+                    found_path = os.path.join(root, filename)
+                    return found_path
+        except Exception as e:
+            log.error("❌ Error in file search for '%s': %s", filename, e)
+            return None
+        
+        log.error("❌ File '%s' not found anywhere", filename)
+        return None
+
+    def handle_api_request(self):
+        """Handle API requests"""
+        try:
+            if self.path == '/api/system':
+                system_info = self.get_system_info()
+                response = json.dumps(system_info, indent=2)
+                
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response.encode('utf-8'))))
+                self.end_headers()
+                self.wfile.write(response.encode('utf-8'))
+            else:
+                self.send_error(404, "API endpoint not found")
+        except Exception as e:
+            log.error("❌ API request error: %s", e)
+            self.send_error(500, "Internal server error")
+
+    def handle_static_asset(self):
+        """Serve the listing stylesheet or script from its pre-encoded bytes"""
+        asset = _STATIC_ASSETS.get(urlparse(self.path).path)
+        if asset is None:
+            self.send_error(404, "File not found")
+            return
+        body, gzipped, content_type, self.etag = asset
+        # The URL is versioned by content, so it can be cached for good
+        self.cache_control = 'public, max-age=31536000, immutable'
+        
+        if _etag_matches(self.headers.get('If-None-Match'), self.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Vary', 'Accept-Encoding')
+        if _accepts_gzip(self.headers.get('Accept-Encoding', '')):
+            self.send_header('Content-Encoding', 'gzip')
+            body = gzipped
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except Exception as e:
+            log.error("❌ Error sending response: %s", e)
+    
+    def handle_dedicated_download(self):
+        """Handle dedicated download requests using file search"""
+        try:
+            # Extract filename from /download/filename
+            filename = unquote(self.path[10:])  # Remove '/download/' prefix
+            log.info("🔍 Download request for: '%s'", filename)
+            
+            # Find the file using recursive search
+            file_path = self.find_file_by_name(filename)
+            
+            if not file_path or not os.path.exists(file_path):
+                log.error("❌ File not found: %s", filename)
+                self.send_error(404, f"File '{filename}' not found")
+                return
+            
+            log.info("✅ Found file: %s", file_path)
+            
+            # Get file info
+            file_size = os.path.getsize(file_path)
+            
+            # Send file
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
+            self.send_header('Content-Length', str(file_size))
+            self.end_headers()
+            
+            # Body goes out through copyfile (sendfile where available)
+            with open(file_path, 'rb') as f:
+                self.copyfile(f, self.wfile)
+                    
+        except Exception as e:
+            log.error("❌ Download error: %s", e)
+            self.send_error(500, "Download failed")
+
+    def handle_video_play(self):
+        """Handle video play requests"""
+        try:
+            # Extract filename from /play/filename
+            filename = unquote(self.path[6:])  # Remove '/play/' prefix
+            log.info("🎥 Video play request for: '%s'", filename)
+            
+            # Find the file using recursive search
+            file_path = self.find_file_by_name(filename)
+            
+            if not file_path or not os.path.exists(file_path):
+                log.error("❌ Video file not found: %s", filename)
+                self.send_error(404, f"Video '{filename}' not found")
+                return
+            
+            log.info("✅ Found video: %s", file_path)
+            
+            # Serve the video file
+            super().do_GET()
+                    
+        except Exception as e:
+            log.error("❌ Video play error: %s", e)
+            self.send_error(500, "Video play failed")
+
+    def generate_enhanced_directory_listing(self, path):
+        """Generate enhanced directory listing"""
+        try:
+            # Resolve against the fixed server root; translate_path drops
+            # '..' components, so the listing can't leave it
+            return self.list_directory(self.translate_path(self.path))
+        except Exception as e:
+            log.error("❌ Directory listing error: %s", e)
+            self.send_error(500, "Directory listing failed")
+    
+    def get_file_category_and_extensions(self):
+        """Define file categories with comprehensive extension mapping"""
+        return _FILE_CATEGORIES
+    
+    def format_file_size(self, size_bytes):
+        """Convert bytes to human-readable format"""
+        return _format_file_size(size_bytes)
+    
+    def get_system_info(self):
+        """Gather comprehensive Linux system information
+
+        The result is shared between requests for _SYS_INFO_TTL seconds;
+        treat it as read-only.
+        """
+        now = time.monotonic()
+        cached = RemoteFileServerHandler._system_info_cache
+        if cached is not None and now - cached[0] < _SYS_INFO_TTL:
+            return cached[1]
+        
+        system_info = dict(self.get_static_system_info())
+        
+        try:
+            # Network information
+            try:
+                # Get primary IP address
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                s.connect(("8.8.8.8", 80))
+                system_info['ip_address'] = s.getsockname()[0]
+                s.close()
+            except OSError:
+                system_info['ip_address'] = 'unavailable'
+            
+            # Boot time and uptime
+            try:
+                with open('/proc/uptime', 'r') as f:
+                    uptime_seconds = float(f.readline().split()[0])
+                    uptime_str = str(datetime.timedelta(seconds=int(uptime_seconds)))
+                    system_info['uptime'] = uptime_str
+                    
+                    system_info['boot_time'] = _format_mtime(int(time.time() - uptime_seconds))
+            except (OSError, ValueError, IndexError):
+                system_info['uptime'] = 'unavailable'
+                system_info['boot_time'] = 'unavailable'
+            
+            # Memory information
+            try:
+                with open('/proc/meminfo', 'r') as f:
+                    # Only two fields are used; both sit near the top
+                    total_mem = available_mem = 0
+                    need = 2
+                    for line in f:
+                        if line.startswith('MemTotal:'):
+                            total_mem = int(line.split()[1]) * 1024  # Convert from KB to bytes
+                            need -= 1
+                        elif line.startswith('MemAvailable:'):
+                            available_mem = int(line.split()[1]) * 1024
+                            need -= 1
+                        if not need:
+                            break
+                    
+                    system_info['memory_total'] = self.format_file_size(total_mem)
+                    system_info['memory_available'] = self.format_file_size(available_mem)
+                    system_info['memory_used'] = self.format_file_size(total_mem - available_mem)
+            except (OSError, ValueError, IndexError):
+                system_info['memory_total'] = 'unavailable'
+                system_info['memory_available'] = 'unavailable'
+                system_info['memory_used'] = 'unavailable'
+            
+            # Load average
+            try:
+                with open('/proc/loadavg', 'r') as f:
+                    loadavg = f.readline().strip().split()[:3]
+                    system_info['load_average'] = f"{loadavg[0]} {loadavg[1]} {loadavg[2]}"
+            except (OSError, IndexError):
+                system_info['load_average'] = 'unavailable'
+            
+            # Current time
+            system_info['current_time'] = _format_mtime(int(time.time()))
+            
+        except Exception as e:
+            log.error("Error gathering system info: %s", e)
+        
+        RemoteFileServerHandler._system_info_cache = (now, system_info)
+        return system_info
+    
+    def get_static_system_info(self):
+        """System details that can't change while the server runs, gathered once"""
+        if RemoteFileServerHandler._static_system_info is not None:
+            return RemoteFileServerHandler._static_system_info
+        
+        system_info = {}
+        
+        try:
+            # Basic system information
+            system_info['hostname'] = socket.gethostname()
+            system_info['fqdn'] = socket.getfqdn()
+            system_info['platform'] = platform.system()
+            system_info['machine'] = platform.machine()
+            system_info['processor'] = platform.processor()
+            system_info['architecture'] = platform.architecture()[0]
+            
+            # Operating system details
+            try:
+                # Detailed OS info from os-release (stdlib parser on 3.10+)
+                try:
+                    os_release = platform.freedesktop_os_release()
+                except AttributeError:
+                    with open('/etc/os-release', 'r') as f:
+                        os_release = {}
+                        for line in f:
+                            if '=' in line:
+                                key, value = line.strip().split('=', 1)
+                                os_release[key] = value.strip('"')
+                
+                system_info['os_name'] = os_release.get('PRETTY_NAME', platform.system())
+                system_info['os_id'] = os_release.get('ID', 'unknown')
+                system_info['os_version'] = os_release.get('VERSION', 'unknown')
+                system_info['os_version_id'] = os_release.get('VERSION_ID', 'unknown')
+            except OSError:
+                system_info['os_name'] = platform.system()
+                system_info['os_id'] = 'unknown'
+                system_info['os_version'] = platform.release()
+                system_info['os_version_id'] = 'unknown'
+            
+            # Kernel information
+            system_info['kernel_name'] = platform.system()
+            system_info['kernel_release'] = platform.release()
+            system_info['kernel_version'] = platform.version()
+            
+            # MAC address
+            try:
+                mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
+                               for elements in range(0,2*6,2)][::-1])
+                system_info['mac_address'] = mac
+            except Exception:
+                system_info['mac_address'] = 'unavailable'
+            
+            # System UUID, read from the kernel's DMI export instead of forking
+            # dmidecode. product_uuid is usually root-only; /etc/machine-id is
+            # not a substitute, it is confidential (machine-id(5)) and must
+            # not be served to clients.
+            try:
+                with open('/sys/class/dmi/id/product_uuid', 'r') as f:
+                    system_info['system_uuid'] = str(uuid.UUID(f.read().strip()))
+            except (OSError, ValueError):
+                system_info['system_uuid'] = _FALLBACK_SYSTEM_UUID
+            
+            # Enhanced CPU information. The logical CPU count comes from the
+            # OS; model details are the same on every processor, so only the
+            # first /proc/cpuinfo block is parsed.
+            try:
+                with open('/proc/cpuinfo', 'r') as f:
+                    first_proc = {}
+                    for line in f:
+                        if line.strip() == '':
+                            if first_proc:
+                                break
+                        elif ':' in line:
+                            key, value = line.split(':', 1)
+                            first_proc[key.strip()] = value.strip()
+                    
+                    # Get CPU details
+                    cpu_count = os.cpu_count() or 'unknown'
+                    system_info['cpu_count'] = cpu_count
+                    system_info['cpu_model'] = first_proc.get('model name', 'unknown')
+                    system_info['cpu_cores'] = first_proc.get('cpu cores', 'unknown')
+                    system_info['cpu_threads'] = cpu_count
+                    system_info['cpu_cache_size'] = first_proc.get('cache size', 'unknown')
+                    system_info['cpu_flags'] = first_proc['flags'][:100] + '...' if first_proc.get('flags') else 'unknown'
+            except OSError:
+                system_info['cpu_count'] = 'unavailable'
+                system_info['cpu_model'] = 'unavailable'
+                system_info['cpu_cores'] = 'unavailable'
+                system_info['cpu_threads'] = 'unavailable'
+                system_info['cpu_cache_size'] = 'unavailable'
+                system_info['cpu_flags'] = 'unavailable'
+            
+        except Exception as e:
+            log.error("Error gathering system info: %s", e)
+        
+        RemoteFileServerHandler._static_system_info = system_info
+        return system_info
+    
+    def generate_system_info_html(self):
+        """Generate system information HTML section with ENDS styling
+
+        Only the details that can't change while the server runs are
+        rendered here. The live ones (marked data-system-info) are filled
+        in by the page script from /api/system, so a listing stays the
+        same bytes until its directory changes.
+        """
+        get = self.get_static_system_info().get
+        os_name = get('os_name', 'Unknown')
+        os_version = get('os_version', 'Unknown')
+        os_id = get('os_id', 'Unknown')
+        architecture = get('architecture', 'Unknown')
+        kernel_name = get('kernel_name', 'Unknown')
+        kernel_release = get('kernel_release', 'Unknown')
+        kernel_version = get('kernel_version', 'Unknown')
+        if len(kernel_version) > 60:
+            kernel_version = kernel_version[:60] + '...'
+        hostname = get('hostname', 'Unknown')
+        fqdn = get('fqdn', 'Unknown')
+        mac_address = get('mac_address', 'Unknown')
+        cpu_model = get('cpu_model', 'Unknown')
+        if len(cpu_model) > 60:
+            cpu_model = cpu_model[:60] + '...'
+        cpu_cores = get('cpu_cores', 'Unknown')
+        cpu_threads = get('cpu_threads', 'Unknown')
+        cpu_cache_size = get('cpu_cache_size', 'Unknown')
+        machine = get('machine', 'Unknown')
+        system_uuid = get('system_uuid', 'Unknown')
+        
+        html = f"""
+        <div class="category-section" style="border-left-color: #e91e63; margin-bottom: 20px;">
+            <div class="category-header" style="border-left-color: #e91e63; background: linear-gradient(135deg, #1a202c 0%, #2d3748 100%);">
+                <span>🖥️ System Information</span>
+            </div>
+            <div class="category-content active">
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 16px; margin-bottom: 16px;">
+                    
+                    <!-- Operating System Info -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #e91e63; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>🐧</span> Operating System
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Distribution:</span>
+                            <span style="color: #e6e6e6; font-weight: 500;">{os_name}</span>
+                            <span style="color: #a0a0a0;">Version:</span>
+                            <span style="color: #e6e6e6;">{os_version}</span>
+                            <span style="color: #a0a0a0;">ID:</span>
+                            <span style="color: #e6e6e6;">{os_id}</span>
+                            <span style="color: #a0a0a0;">Architecture:</span>
+                            <span style="color: #e6e6e6;">{architecture}</span>
+                        </div>
+                    </div>
+                    
+                    <!-- Kernel Info -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #4fc3f7; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>⚙️</span> Kernel
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Name:</span>
+                            <span style="color: #e6e6e6; font-weight: 500;">{kernel_name}</span>
+                            <span style="color: #a0a0a0;">Release:</span>
+                            <span style="color: #e6e6e6;">{kernel_release}</span>
+                            <span style="color: #a0a0a0;">Version:</span>
+                            <span style="color: #e6e6e6; font-size: 0.8em;">{kernel_version}</span>
+                        </div>
+                    </div>
+                    
+                    <!-- Network Info -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #81c784; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>🌐</span> Network
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Hostname:</span>
+                            <span style="color: #e6e6e6; font-weight: 500;">{hostname}</span>
+                            <span style="color: #a0a0a0;">FQDN:</span>
+                            <span style="color: #e6e6e6;">{fqdn}</span>
+                            <span style="color: #a0a0a0;">IP Address:</span>
+                            <span data-system-info="ip_address" style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">…</span>
+                            <span style="color: #a0a0a0;">MAC Address:</span>
+                            <span style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{mac_address}</span>
+                        </div>
+                    </div>
+                    
+                    <!-- Enhanced CPU Info -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #ff8a65; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>🔧</span> CPU Details
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Model:</span>
+                            <span style="color: #e6e6e6; font-weight: 500; font-size: 0.8em;">{cpu_model}</span>
+                            <span style="color: #a0a0a0;">Physical Cores:</span>
+                            <span style="color: #e6e6e6;">{cpu_cores}</span>
+                            <span style="color: #a0a0a0;">Logical Threads:</span>
+                            <span style="color: #e6e6e6;">{cpu_threads}</span>
+                            <span style="color: #a0a0a0;">Cache Size:</span>
+                            <span style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{cpu_cache_size}</span>
+                            <span style="color: #a0a0a0;">Architecture:</span>
+                            <span style="color: #e6e6e6;">{machine}</span>
+                        </div>
+                    </div>
+                    
+                    <!-- System UUID -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #90caf9; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>🆔</span> System Identity
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Hostname:</span>
+                            <span style="color: #e6e6e6; font-weight: 500;">{hostname}</span>
+                            <span style="color: #a0a0a0;">FQDN:</span>
+                            <span style="color: #e6e6e6;">{fqdn}</span>
+                            <span style="color: #a0a0a0;">System UUID:</span>
+                            <span style="color: #e6e6e6; font-family: monospace; font-size: 0.8em; background: #1a202c; padding: 2px 6px; border-radius: 4px;">{system_uuid}</span>
+                        </div>
+                    </div>
+                    
+                    <!-- Memory Info -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #ba68c8; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>🧠</span> Memory
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Total:</span>
+                            <span data-system-info="memory_total" style="color: #e6e6e6; font-weight: 500;">…</span>
+                            <span style="color: #a0a0a0;">Used:</span>
+                            <span data-system-info="memory_used" style="color: #ff8a65;">…</span>
+                            <span style="color: #a0a0a0;">Available:</span>
+                            <span data-system-info="memory_available" style="color: #81c784;">…</span>
+                            <span style="color: #a0a0a0;">Load Average:</span>
+                            <span data-system-info="load_average" style="color: #e6e6e6; font-family: monospace; background: #1a202c; padding: 2px 6px; border-radius: 4px;">…</span>
+                        </div>
+                    </div>
+                    
+                    <!-- System Status -->
+                    <div style="background: #2d3748; border: 1px solid #4a5568; border-radius: 8px; padding: 16px;">
+                        <h4 style="color: #ffb74d; margin: 0 0 12px 0; font-size: 1.1em; display: flex; align-items: center; gap: 8px;">
+                            <span>⏰</span> System Status
+                        </h4>
+                        <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 8px; font-size: 0.9em;">
+                            <span style="color: #a0a0a0;">Current Time:</span>
+                            <span data-system-info="current_time" style="color: #e6e6e6; font-weight: 500;">…</span>
+                            <span style="color: #a0a0a0;">Boot Time:</span>
+                            <span data-system-info="boot_time" style="color: #e6e6e6;">…</span>
+                            <span style="color: #a0a0a0;">Uptime:</span>
+                            <span data-system-info="uptime" style="color: #81c784; font-weight: 500;">…</span>
+                        </div>
+                    </div>
+                    
+                </div>
+            </div>
+        </div>
+        """
+        
+        return html
+    
+    def get_absolute_display_path(self, path):
+        """Absolute display path of a listed directory, clamped to the server root
+
+        path is the translate_path result that is actually listed, not the
+        raw URL, so '..' segments can't name directories above the root.
+        """
+        root = os.path.abspath(self.directory)
+        path = os.path.abspath(path)
+        if os.path.commonpath([root, path]) != root:
+            return root
+        return path
+    
+    def list_directory(self, path):
+        """ENDS-style directory listing with navigation and categorization"""
+        try:
+            scan = _scan_directory(path)
+        except OSError as e:
+            log.error("❌ Directory access error: %s (%s)", path, e)
+            self.send_error(404, "No permission to list directory")
+            return None
+        except Exception as e:
+            log.error("❌ Unexpected error accessing directory: %s (%s)", path, e)
+            self.send_error(500, "Internal server error")
+            return None
         
-        <div class="stats-container">
-            {stats_html}
-        </div>
+        # Optional paging for large directories: ?cat=<category> renders a
+        # single category, limit/offset slice each rendered category
+        query = parse_qs(urlparse(self.path).query)
+        only_category = query.get('cat', [None])[0]
+        offset = _query_int(query, 'offset', 0)
+        # limit=0 would page forever: every slice empty, rel="next" to itself
+        limit = _query_int(query, 'limit', None, minimum=1)
+        
+        # Files within each category are already newest first
+        categorized_files = {}
+        has_more = False
+        for category, files in scan.categories:
+            if only_category and category != only_category:
+                continue
+            if limit is not None:
+                has_more = has_more or len(files) > offset + limit
+                page = files[offset:offset + limit]
+            else:
+                page = files[offset:]
+            # Categories paged past their end are dropped here, so everything
+            # downstream only sees non-empty ones
+            if page:
+                categorized_files[category] = page
+        
+        paged = bool(only_category or offset or limit is not None)
+        
+        # A listing is a function of the scan and the path it shows (the
+        # live system details are loaded by the page script), so an
+        # unchanged directory keeps its tag across rescans and a reload
+        # costs a 304 without rendering anything. It is weak because the
+        # gzip and identity bodies share it.
+        display_path = self.get_absolute_display_path(path)
+        path_tag = hashlib.sha1(display_path.encode('utf-8', 'surrogateescape')).hexdigest()[:8]
+        self.etag = f'W/"{_PAGE_EPOCH}-{scan.fingerprint}-{path_tag}"'
+        self.cache_control = 'no-cache'
+        if _etag_matches(self.headers.get('If-None-Match'), self.etag[2:]):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return None
         
-        {navigation_html}
+        # Listing markup is very repetitive, so gzip it for clients that
+        # accept it: buffered pages at level 6, streamed ones on the fly at
+        # level 1, which keeps most of the ratio at a fraction of the CPU
+        # cost. Unpaged bodies don't change while the scan doesn't, so
+        # their gzipped form is kept with it, keyed by the display path
+        # for the page and by the category for a section.
+        use_gzip = _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        gzip_cache = scan.gzipped if use_gzip and not paged else None
+        
+        # ?section=<category> returns just that category's cards, for the
+        # collapsed stubs of a lazily loaded listing
+        section = query.get('section', [None])[0]
+        if section is not None:
+            if section in categorized_files:
+                self.send_section_fragment(categorized_files[section], scan.cards_html,
+                                           gzip_cache, ('section', section))
+            else:
+                # Unknown names get an empty fragment that isn't cached, so
+                # clients can't add arbitrary keys to the scan
+                self.send_section_fragment(())
+            return None
         
-        {categories_html}
-    </div>
+        # Lazy stubs fetch their cards with the same paging as this page
+        lazy_query = {}
+        if offset:
+            lazy_query['offset'] = offset
+        if limit is not None:
+            lazy_query['limit'] = limit
+        
+        # Small listings are rendered completely up front so they can be sent
+        # with a Content-Length in one write; large ones are streamed
+        entry_count = sum(len(files) for files in categorized_files.values())
+        buffered = entry_count <= _STREAM_THRESHOLD
+        
+        # Render the page head (or the whole page) before committing to a 200
+        page_key = ('page', display_path)
+        body = gzip_cache.get(page_key) if gzip_cache is not None and buffered else None
+        if body is None:
+            try:
+                # The scan's totals describe the whole directory; a paged or
+                # filtered view counts what it shows
+                totals = None if paged else scan.totals
+                sections = self.iter_ends_style_html(path, categorized_files, scan.child_dirs,
+                                                     lazy_query, totals, scan.cards_html)
+                if buffered:
+                    # One join and one encode: the page is never copied again
+                    # before it is written
+                    body = ''.join(sections).encode('utf-8')
+                    if use_gzip:
+                        body = gzip.compress(body, 6)
+                        if gzip_cache is not None:
+                            gzip_cache[page_key] = body
+                else:
+                    head = next(sections).encode('utf-8')
+            except Exception as e:
+                log.error("❌ Error generating listing: %s", e)
+                self.send_error(500, "Internal server error")
+                return None
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if has_more:
+            next_query = {'offset': offset + limit, 'limit': limit}
+            if only_category:
+                next_query['cat'] = only_category
+            self.send_header("Link", f'<?{urlencode(next_query)}>; rel="next"')
+        
+        if buffered:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except Exception as e:
+                log.error("❌ Error sending response: %s", e)
+            return None
+        
+        # Stream the remaining sections as they are rendered. There is no
+        # Content-Length, so closing the connection delimits the body.
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 31) if use_gzip else None
+        self.end_headers()
+        self.close_connection = True
+        # Coalesce the small per-category writes into fewer, larger sends
+        pending, pending_size = [head], len(head)
+        try:
+            for section in sections:
+                chunk = section.encode('utf-8')
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= _WRITE_BUFFER_SIZE:
+                    data = b''.join(pending)
+                    self.wfile.write(compressor.compress(data) if compressor else data)
+                    pending, pending_size = [], 0
+            data = b''.join(pending)
+            if compressor is not None:
+                data = compressor.compress(data) + compressor.flush()
+            self.wfile.write(data)
+        except Exception as e:
+            log.error("❌ Error sending response: %s", e)
+        return None
     
-    <script>
-        // Toggle category sections
-        document.querySelectorAll('.category-header').forEach(header => {{
-            header.addEventListener('click', function() {{
-                const content = this.nextElementSibling;
-                const isActive = content.classList.contains('active');
-                
-                if (isActive) {{
-                    content.classList.remove('active');
-                    this.style.transform = 'none';
-                }} else {{
-                    content.classList.add('active');
-                    this.style.transform = 'translateX(5px)';
-                }}
-            }});
-        }});
+    def send_section_fragment(self, files, render_cards=_render_files_html,
+                              gzip_cache=None, cache_key=None):
+        """Send the rendered cards of one category as an HTML fragment
+
+        gzip_cache, when given, holds the gzipped fragment under cache_key.
+        """
+        use_gzip = _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        body = gzip_cache.get(cache_key) if gzip_cache is not None else None
+        if body is None:
+            body = render_cards(files).encode('utf-8')
+            if use_gzip:
+                body = gzip.compress(body, 6)
+                if gzip_cache is not None:
+                    gzip_cache[cache_key] = body
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except Exception as e:
+            log.error("❌ Error sending response: %s", e)
+    
+    def generate_ends_style_html(self, path, categorized_files, child_dirs=None):
+        """Generate HTML with ENDS styling and layout"""
+        return ''.join(self.iter_ends_style_html(path, categorized_files, child_dirs))
+    
+    def iter_ends_style_html(self, path, categorized_files, child_dirs=None, lazy_query=None,
+                             totals=None, render_cards=_render_files_html):
+        """Yield the ENDS-style page in pieces: head, one per category, tail
+
+        totals is (files, directories, total size) when the caller already
+        has them, otherwise they are counted from categorized_files.
+        render_cards renders a category's cards, normally the cached
+        DirectoryScan.cards_html of the scan categorized_files came from.
+        """
         
-        // Initialize - show navigation and directories by default
-        document.querySelectorAll('.category-section').forEach((section, index) => {{
-            if (index < 2) {{ // Show first 2 categories by default
-                section.querySelector('.category-content').classList.add('active');
-                section.querySelector('.category-header').style.transform = 'translateX(5px)';
-            }}
-        }});
+        # The breadcrumb shows the directory that was listed
+        display_path = self.get_absolute_display_path(path)
+        display_path_html = html.escape(display_path)
         
-        // Add click handlers for thumbnail images to open in new tab
-        document.addEventListener('click', function(e) {{
-            if (e.target.classList.contains('thumbnail-image')) {{
-                e.preventDefault();
-                window.open(e.target.src, '_blank');
-            }}
-        }});
+        # Calculate statistics in a single pass over the categories, unless
+        # the scan already counted them
+        if totals is not None:
+            total_files, total_dirs, total_size = totals
+        else:
+            total_dirs = len(categorized_files.get('Directories', ()))
+            total_files = total_size = 0
+            for category, files in categorized_files.items():
+                if category == 'Directories':
+                    continue
+                total_files += len(files)
+                for file_info in files:
+                    total_size += file_info.size_bytes
+        total_size_str = self.format_file_size(total_size)
         
-        // SIMPLE video setup - no complex activation
-        function setupVideos() {{
-            console.log('=== SIMPLE VIDEO SETUP ===');
-            
-            const allVideos = document.querySelectorAll('.video-preview-player');
-            console.log('Found', allVideos.length, 'videos');
-            
-            // Simple preload for all videos
-            allVideos.forEach((video, index) => {{
-                console.log('Setting up video', index);
-                
-                video.preload = 'metadata';
-                video.load();
-                
-                // Set source directly for better compatibility
-                const source = video.querySelector('source');
-                if (source && source.src) {{
-                    video.src = source.src;
-                }}
-                
-                // Simple metadata handler
-                video.addEventListener('loadedmetadata', function() {{
-                    console.log('Video', index, 'metadata loaded');
-                    this.currentTime = 0.5;
-                }}, {{ once: true }});
-            }});
-            
-            // ONE-TIME activation on first user interaction anywhere on page
-            let activated = false;
-            const activateAllVideos = () => {{
-                if (activated) return;
-                activated = true;
-                
-                console.log('=== ACTIVATING ALL VIDEOS ON FIRST INTERACTION ===');
-                
-                allVideos.forEach((video, index) => {{
-                    setTimeout(() => {{
-                        video.play().then(() => {{
-                            console.log('Video', index, 'activated');
-                            video.pause();
-                            video.currentTime = 0.5;
-                        }}).catch(e => {{
-                            console.log('Video', index, 'activation failed:', e);
-                        }});
-                    }}, index * 50);
-                }});
-            }};
-            
-            // Listen for ANY user interaction to activate videos
-            ['click', 'mousedown', 'touchstart', 'keydown'].forEach(eventType => {{
-                document.addEventListener(eventType, activateAllVideos, {{ once: true }});
-            }});
-        }}
-            
-        // Setup interactions
-        function setupInteractions() {{
-            // Preview interactions
-            document.querySelectorAll('.video-static-thumb').forEach((thumb, index) => {{
-                const container = thumb.closest('.video-row-container');
-                const previewArea = container.querySelector('.video-preview-area');
-                const videoPlayer = container.querySelector('.video-preview-player');
-                
-                if (!previewArea || !videoPlayer) return;
-                
-                let previewTimeout = null;
-                
-                thumb.addEventListener('mouseenter', function() {{
-                    console.log('Hover video', index);
-                    
-                    if (previewTimeout) clearTimeout(previewTimeout);
-                    
-                    previewArea.style.display = 'block';
-                    videoPlayer.currentTime = 0;
-                    
-                    videoPlayer.play().catch(e => {{
-                        console.log('Video play failed:', e);
-                    }});
-                    
-                    previewTimeout = setTimeout(() => {{
-                        previewArea.style.display = 'none';
-                        videoPlayer.pause();
-                    }}, 60000);
-                }});
-                
-                thumb.addEventListener('mouseleave', function() {{
-                    setTimeout(() => {{
-                        if (!previewArea.matches(':hover')) {{
-                            previewArea.style.display = 'none';
-                            videoPlayer.pause();
-                            if (previewTimeout) clearTimeout(previewTimeout);
-                        }}
-                    }}, 100);
-                }});
-                
-                previewArea.addEventListener('mouseleave', function() {{
-                    this.style.display = 'none';
-                    videoPlayer.pause();
-                    if (previewTimeout) clearTimeout(previewTimeout);
-                }});
-            }});
-            
-            // Download buttons - SIMPLE approach
-            document.querySelectorAll('.download-btn').forEach(btn => {{
-                btn.addEventListener('click', function(e) {{
-                    console.log('Download clicked:', this.href);
-                    
-                    // Pause videos to free bandwidth
-                    document.querySelectorAll('.video-preview-player').forEach(video => {{
-                        video.pause();
-                    }});
-                    
-                    // Let browser handle download naturally
-                }});
-            }});
-            
-            // Play video buttons
-            document.querySelectorAll('.play-video-btn').forEach(btn => {{
-                btn.addEventListener('click', function(e) {{
-                    console.log('Play video clicked:', this.href);
-                    
-                    // Pause previews
-                    document.querySelectorAll('.video-preview-player').forEach(video => {{
-                        video.pause();
-                    }});
-                }});
-            }});
-        }}
+        # Generate stats HTML
+        stats_html = f"""
+        <div class="stats-grid">
+            <div class="stat-item">
+                <div class="stat-number">{total_dirs}</div>
+                <div class="stat-label">Directories</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">{total_files}</div>
+                <div class="stat-label">Files</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">{total_size_str}</div>
+                <div class="stat-label">Total Size</div>
+            </div>
+        </div>
+"""
         
-        // Simple initialization
-        function initializeEverything() {{
-            setupVideos();
-            setupInteractions();
-        }}
+        # Generate system information HTML
+        system_info_html = self.generate_system_info_html()
         
-        // Initialize
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', initializeEverything);
-        }} else {{
-            initializeEverything();
-        }}
+        # Generate navigation HTML
+        navigation_html = self.generate_navigation_html(path, display_path, child_dirs)
         
-        setTimeout(initializeEverything, 300);
-    </script>
-</body>
-</html>'''
+        yield _PAGE_TITLE.format(display_path=display_path_html)
+        yield _CSS_BLOCK
+        yield _PAGE_HEAD.format(display_path=display_path_html,
+                                system_info_html=system_info_html, stats_html=stats_html,
+                                navigation_html=navigation_html)
         
-        return html
+        # Category sections are yielded one at a time
+        yield from self.iter_category_sections_html(categorized_files, lazy_query, render_cards)
+        
+        yield _PAGE_TAIL
     
-    def generate_navigation_html(self, path):
-        # Get both the URL path and absolute display path
-        url_path = unquote(self.path)
-        display_path = self.get_absolute_display_path(self.path)
-        navigation_html = '''
-        <div class="category-section" style="border-left-color: #4fc3f7;">
-            <div class="category-header" style="border-left-color: #4fc3f7;">
-                <span>🧭 Directory Navigation</span>
-            </div>
-            <div class="category-content">
-                <div class="file-grid">
-'''
+    def generate_navigation_html(self, path, display_path=None, child_dirs=None):
+        if display_path is None:
+            display_path = self.get_absolute_display_path(path)
+        parts = [_NAV_SECTION_OPEN]
         
-        # Add parent directory if not at root
-        if url_path != '/' and url_path != '':
-            # For URL navigation, use the URL path
-            parent_url_path = os.path.dirname(url_path.rstrip('/'))
-            if parent_url_path == '':
-                parent_url_path = '/'
-            
-            # For display, use the absolute path
-            parent_absolute_path = os.path.dirname(display_path.rstrip('/'))
-            parent_name = os.path.basename(parent_absolute_path) if parent_absolute_path else 'Parent'
-            
-            navigation_html += f'''
-                    <div class="file-item" data-filename="parent" data-original-name=".." data-extension="" data-size-bytes="0" data-modified="2000-01-01 00:00:00" data-hidden="false">
-                        <div class="file-header">
-                            <span class="file-icon">📁</span>
-                            <div class="file-name">⬆️ {parent_name} (Parent Directory)</div>
-                        </div>
-                        <div class="file-actions">
-                            <a href="../" class="action-btn view-btn">Go Up</a>
-                        </div>
-                        <div class="file-details">
-                            <div class="file-info-row">
-                                <span class="file-size">Directory</span>
-                                <span>Parent</span>
-                            </div>
-                            <div class="file-path">{parent_absolute_path}</div>
-                        </div>
-                    </div>
-'''
+        # Split the display path once; the parent link itself is relative ("../")
+        display = PurePosixPath(display_path)
         
-        # Add current directory info
-        current_dir_name = os.path.basename(display_path) if display_path not in ['/', ''] else 'Root'
-        navigation_html += f'''
-                    <div class="file-item" data-filename="current" data-original-name="{current_dir_name}" data-extension="" data-size-bytes="0" data-modified="2000-01-01 00:00:00" data-hidden="false" style="background: #2d3748; border: 2px solid #4fc3f7;">
-                        <div class="file-header">
-                            <span class="file-icon">📂</span>
-                            <div class="file-name">📍 {current_dir_name} (Current Directory)</div>
-                        </div>
-                        <div class="file-actions">
-                            <span class="action-btn" style="background: #4fc3f7; color: #000;">Current</span>
-                        </div>
-                        <div class="file-details">
-                            <div class="file-info-row">
-                                <span class="file-size">Directory</span>
-                                <span>Current</span>
-                            </div>
-                            <div class="file-path">{display_path}</div>
-                        </div>
-                    </div>
-'''
+        # Add parent directory if not at the server root
+        if display_path != os.path.abspath(self.directory):
+            parent = display.parent
+            parts.append(_NAV_PARENT_ITEM.format(parent_name=html.escape(parent.name),
+                                                 parent_path=html.escape(str(parent))))
         
-        # Find and add child directories with quick access
-        child_dirs = []
-        try:
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path) and not item.startswith('.'):
-                    try:
-                        # Count files in subdirectory
-                        subdir_files = len([f for f in os.listdir(item_path) if not f.startswith('.')])
-                        child_dirs.append((item, subdir_files))
-                    except:
-                        child_dirs.append((item, 0))
-        except:
-            pass
+        # Add current directory info
+        current_dir_name = display.name or 'Root'
+        parts.append(_NAV_CURRENT_ITEM.format(name=html.escape(current_dir_name),
+                                              path=html.escape(display_path)))
+        
+        # Find and add child directories with quick access. The listing
+        # passes in the (name, entry count) pairs of its cached scan so the
+        # directories aren't re-read.
+        if child_dirs is None:
+            try:
+                with os.scandir(path) as entries:
+                    child_names = [entry.name for entry in entries
+                                   if not entry.name.startswith('.') and entry.is_dir()]
+            except OSError:
+                child_names = []
+            child_dirs = [(item, _count_visible_entries(os.path.join(path, item)))
+                          for item in child_names]
         
         if child_dirs:
-            # Sort by number of files (most important directories first)
-            child_dirs.sort(key=lambda x: x[1], reverse=True)
-            for dir_name, file_count in child_dirs[:5]:  # Show top 5 subdirectories
-                navigation_html += f'''
-                    <div class="file-item" data-filename="{dir_name.lower()}" data-original-name="{dir_name}" data-extension="" data-size-bytes="0" data-modified="2000-01-01 00:00:00" data-hidden="false">
-                        <div class="file-header">
-                            <span class="file-icon">📁</span>
-                            <div class="file-name">⬇️ {dir_name}</div>
-                        </div>
-                        <div class="file-actions">
-                            <a href="{dir_name}/" class="action-btn view-btn">Enter</a>
-                        </div>
-                        <div class="file-details">
-                            <div class="file-info-row">
-                                <span class="file-size">{file_count} files</span>
-                                <span>Subdirectory</span>
-                            </div>
-                        </div>
-                    </div>
-'''
+            # Top 5 subdirectories by number of files (most important first)
+            for dir_name, file_count in heapq.nlargest(5, child_dirs, key=itemgetter(1)):
+                dir_name_html = html.escape(dir_name)
+                parts.append(_NAV_CHILD_ITEM.format(name_lower=dir_name_html.lower(), name=dir_name_html,
+                                                    name_url=quote(dir_name),
+                                                    file_count=file_count))
         
-        navigation_html += '''
-                </div>
-            </div>
-        </div>
-'''
+        parts.append(_NAV_SECTION_CLOSE)
         
-        return navigation_html
+        return ''.join(parts)
     
     def generate_category_sections_html(self, categorized_files):
         """Generate category sections with ENDS styling"""
-        category_icons = {
-            'Directories': '📁',
-            'Python Scripts': '🐍',
-            'Shell Scripts': '⚡',
-            'Log Files': '📋',
-            'CSV Data': '📊',
-            'JSON Files': '🔧',
-            'HTML Files': '🌐',
-            'Documents': '📄',
-            'Text Files': '📝',
-            'Spreadsheets': '📈',
-            'Stylesheets': '🎨',
-            'JavaScript': '⚡',
-            'Images': '🖼️',
-            'Videos': '🎥',
-            'Audio': '🎵',
-            'Archives': '📦',
-            'Configuration': '⚙️',
-            'Database': '🗄️',
-            'XML Files': '📋',
-            'Binary': '⚙️',
-            'Certificates': '🔐',
-            'Data Files': '💾',
-            'Templates': '📋',
-            'Backup Files': '💾',
-            'Temporary Files': '🗑️',
-            'System Files': '⚙️',
-            'Other Files': '📄'
-        }
-        
-        sections_html = []
-        
-        # Sort categories: Directories first, then by file count
-        sorted_categories = []
-        if 'Directories' in categorized_files and categorized_files['Directories']:
-            sorted_categories.append(('Directories', len(categorized_files['Directories'])))
-        
-        other_categories = [(cat, len(files)) for cat, files in categorized_files.items() 
-                           if cat != 'Directories' and files]
-        other_categories.sort(key=lambda x: x[1], reverse=True)
-        sorted_categories.extend(other_categories)
+        return '\n'.join(self.iter_category_sections_html(categorized_files))
+    
+    def iter_category_sections_html(self, categorized_files, lazy_query=None,
+                                    render_cards=_render_files_html):
+        """Yield the HTML of each category section (categories are non-empty)
+
+        With lazy_query (the paging parameters of the page), large
+        categories after the first two are yielded as empty stubs that
+        the page script fills from ?section=<category> when opened.
+        """
+        # Directories first, then by file count
+        sorted_categories = sorted(
+            ((category, files, len(files)) for category, files in categorized_files.items()),
+            key=lambda item: (item[0] != 'Directories', -item[2]))
         
-        for category, count in sorted_categories:
-            files = categorized_files[category]
-            if not files:
-                continue
-                
-            category_icon = category_icons.get(category, '📄')
+        for index, (category, files, count) in enumerate(sorted_categories):
+            category_icon = _CATEGORY_ICONS.get(category, '📄')
             
-            files_html = []
-            for file_info in files:
-                if file_info['is_dir']:
-                    file_icon = '📁'
-                    actions = f'<a href="{file_info["name"]}/" class="action-btn view-btn">Enter</a>'
-                    details = f'''
-                        <div class="file-info-row">
-                            <span class="file-size">Directory</span>
-                            <span>Subdirectory</span>
-                        </div>'''
-                else:
-                    _, ext = os.path.splitext(file_info['name'].lower())
-                    file_icon = self.get_file_icon(ext)
-                    
-                    # Special handling for video files - no actions needed (handled in video gallery)
-                    video_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.mpeg', '.mpg', '.m4v', '.3gp', '.ogv']
-                    if ext in video_extensions:
-                        actions = ''  # No separate actions - handled in video gallery layout
-                    else:
-                        actions = f'<a href="{file_info["name"]}" class="action-btn view-btn">View</a><a href="{file_info["name"]}" download class="action-btn download-btn">Download</a>'
-                    details = f'''
-                        <div class="file-info-row">
-                            <span class="file-size">{file_info["size"]}</span>
-                            <span>{file_info["modified"]}</span>
-                        </div>'''
-                    
-                    # Check if this is an image file for thumbnail display
-                    image_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.ico', '.svg']
-                    is_image = ext in image_extensions
-                    file_info['is_image'] = is_image
-                    
-                    # Check if this is a video file for thumbnail display
-                    video_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.mpeg', '.mpg', '.m4v', '.3gp', '.ogv']
-                    is_video = ext in video_extensions
-                    file_info['is_video'] = is_video
-                
-                # Generate thumbnail HTML for image and video files
-                thumbnail_html = ""
-                if not file_info['is_dir']:
-                    if file_info.get('is_image', False):
-                        thumbnail_html = f'''
-                            <div class="thumbnail-container">
-                                <img src="{file_info['name']}" alt="Thumbnail of {file_info['name']}" class="thumbnail-image" loading="lazy" onerror="this.parentElement.style.display='none'">
-                            </div>'''
-                    elif file_info.get('is_video', False):
-                        thumbnail_html = f'''
-                            <div class="video-row-container" style="display: flex; align-items: flex-start; gap: 20px; width: 100%; background: #1a1f2e; border: 1px solid #4a5568; border-radius: 8px; padding: 20px; margin-bottom: 15px;">
-                                <!-- Static Video Thumbnail -->
-                                <div class="video-static-thumb" data-video-url="{file_info['name']}" style="width: 200px; height: 150px; background: linear-gradient(135deg, #2d3748 0%, #1a202c 100%); border: 2px solid #ff6b6b; border-radius: 4px; display: flex; flex-direction: column; align-items: center; justify-content: center; color: #ff6b6b; font-size: 1.5em; cursor: pointer; flex-shrink: 0;">
-                                    🎬
-                                    <div style="font-size: 0.4em; margin-top: 5px; color: #aaa; text-align: center;">Hover for Preview</div>
-                                </div>
-                                
-                                <!-- Video Preview Area -->
-                                <div class="video-preview-area" style="width: 300px; height: 225px; background: #000; border: 2px solid #ff6b6b; border-radius: 4px; display: none; flex-shrink: 0;">
-                                    <video class="video-preview-player" muted loop preload="metadata" style="width: 100%; height: 100%; border-radius: 2px;">
-                                        <source src="{file_info['name']}" type="video/mp4">
-                                    </video>
-                                </div>
-                                
-                                <!-- Video Information -->
-                                <div class="video-info" style="flex: 1; color: #e6e6e6;">
-                                    <h3 style="color: #81c784; font-weight: bold; margin: 0 0 10px 0; font-size: 1.2em; word-break: break-word;">{file_info['name']}</h3>
-                                    <div style="display: grid; grid-template-columns: auto 1fr; gap: 8px 15px; font-size: 0.9em; margin-bottom: 15px;">
-                                        <span style="color: #aaa;">Size:</span>
-                                        <span style="color: #4fc3f7; font-weight: 500;">{file_info['size']}</span>
-                                        <span style="color: #aaa;">Modified:</span>
-                                        <span style="color: #81c784;">{file_info['modified']}</span>
-                                        <span style="color: #aaa;">Type:</span>
-                                        <span style="color: #ff8a65;">Video File ({ext.upper()})</span>
-                                    </div>
-                                    <div class="video-actions" style="display: flex; gap: 10px;">
-                                        <a href="{file_info['name']}" class="action-btn play-video-btn" target="_blank" rel="noopener noreferrer" style="background: #ff6b6b; color: white; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-weight: 500; transition: background 0.3s;">▶️ Play Video</a>
-                                        <a href="{file_info['name']}" download class="action-btn download-btn" style="background: #2d3748; color: #e6e6e6; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-weight: 500; transition: background 0.3s;">⬇️ Download</a>
-                                    </div>
-                                </div>
-                            </div>'''
-                
-                has_media_thumbnail = (file_info.get('is_image', False) or file_info.get('is_video', False)) and not file_info['is_dir']
-                files_html.append(f'''
-                    <div class="file-item {('has-thumbnail' if has_media_thumbnail else '')}" data-filename="{file_info['name'].lower()}" data-original-name="{file_info['name']}" data-extension="{ext if not file_info['is_dir'] else ''}" data-size-bytes="{file_info['size_bytes']}" data-modified="{file_info['modified']}" data-hidden="false">
-                        <div class="file-header">
-                            <span class="file-icon">{file_icon}</span>
-                            <div class="file-name">{file_info['name']}</div>
-                        </div>
-                        {thumbnail_html}
-                        <div class="file-actions">
-                            {actions}
-                        </div>
-                        <div class="file-details">
-                            {details}
-                        </div>
-                    </div>
-                ''')
+            if lazy_query is not None and index >= 2 and count > _LAZY_SECTION_MIN:
+                lazy_url = '?' + urlencode({'section': category, **lazy_query})
+                lazy_attr = f' data-lazy-url="{html.escape(lazy_url)}"'
+                files_html = ''
+            else:
+                lazy_attr = ''
+                files_html = render_cards(files)
             
             # Use different grid class for videos vs other files
             grid_class = "file-grid" if category == 'Videos' else "file-grid non-video"
-            sections_html.append(f'''
-                <div class="category-section">
-                    <div class="category-header">
-                        <span>{category_icon} {category} ({count})</span>
-                    </div>
-                    <div class="category-content">
-                        <div class="{grid_class}">
-                            {''.join(files_html)}
-                        </div>
-                    </div>
-                </div>
-            ''')
-        
-        return '\n'.join(sections_html)
+            yield _CATEGORY_SECTION.format(icon=category_icon, category=category, count=count,
+                                           grid_class=grid_class, files_html=files_html,
+                                           lazy_attr=lazy_attr)
+    
+    def render_file_item(self, file_info):
+        """Render one file or directory card"""
+        return _render_file_item(file_info)
     
     def get_file_icon(self, ext):
         """Get appropriate icon for file extension"""
-        icon_map = {
-            '.py': '🐍', '.sh': '⚡', '.log': '📋', '.csv': '📊', '.json': '🔧',
-            '.html': '🌐', '.htm': '🌐', '.docx': '📄', '.txt': '📝', '.xlsx': '📈',
-            '.css': '🎨', '.js': '⚡', '.png': '🖼️', '.jpg': '🖼️', '.pdf': '📄',
-            '.mp4': '🎥', '.mp3': '🎵', '.zip': '📦', '.conf': '⚙️', '.sql': '🗄️'
-        }
-        return icon_map.get(ext, '📄')
+        return _ICON_MAP.get(ext, '📄')
+
+
+class FileServer(ThreadingHTTPServer):
+    """Thread-per-connection server that can share its port with sibling processes
+
+    Downloads and video streams hold their thread until the client stops
+    reading, so connections are not funnelled through a fixed pool where
+    a few stalled transfers would starve every other request.
+    """
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    # listen() backlog; the default of 5 overflows when a page load opens
+    # a burst of connections at once
+    request_queue_size = 128
+    # Set SO_REUSEPORT so several forked workers can bind the same port and
+    # let the kernel spread incoming connections across them
+    reuse_port = False
+    
+    def server_bind(self):
+        if self.reuse_port and hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def configure_logging(level=logging.INFO):
+    """Send handler log records to stdout with a short timestamp
+
+    Request threads still merge each record's message and arguments
+    (QueueHandler.prepare) before putting it on a queue; a listener
+    thread adds the timestamp and does the stdout writes, so a slow
+    terminal or pipe never holds up a response. The listener doesn't
+    survive fork(), so call this in each worker process. Returns the
+    started listener; stop() it on shutdown to flush what is still
+    queued.
+    """
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', datefmt='%H:%M:%S'))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, output)
+    listener.start()
+    
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    return listener
 
 
 def run_server(port=8081, directory=None):
     """Run the enhanced file server"""
     if directory:
         os.chdir(directory)
+    listener = configure_logging()
     
     print(f"🌐 Remote Advanced File Browser")
     print(f"📁 Serving directory: {os.getcwd()}")
@@ -1545,12 +2354,15 @@ def run_server(port=8081, directory=None):
     print("=" * 60)
     
     try:
-        with socketserver.TCPServer(("", port), RemoteFileServerHandler) as httpd:
+        handler = partial(RemoteFileServerHandler, directory=os.getcwd())
+        with FileServer(("", port), handler) as httpd:
             httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        listener.stop()
 
 def get_network_interface_ip():
     """Get the IP address of the primary network interface (standalone function)"""
@@ -1581,7 +2393,7 @@ def get_network_interface_ip():
                         ip = addresses[netifaces.AF_INET][0]['addr']
                         if ip != '127.0.0.1':
                             return ip, interface
-                except:
+                except (ValueError, KeyError, IndexError):
                     continue
         
     except ImportError:
@@ -1592,7 +2404,7 @@ def get_network_interface_ip():
             ip = s.getsockname()[0]
             s.close()
             return ip, 'unknown'
-        except:
+        except OSError:
             pass
     
     return 'unavailable', 'unknown'
@@ -1605,6 +2417,8 @@ def main():
     parser.add_argument('--port', '-p', type=int, default=8081, help='Server port (default: 8081)')
     parser.add_argument('--host', default='auto', help='Server host (default: auto-detect)')
     parser.add_argument('--directory', '-d', default='.', help='Directory to serve (default: current)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Server processes sharing the port via SO_REUSEPORT (default: 1)')
     
     args = parser.parse_args()
     
@@ -1635,14 +2449,27 @@ def main():
     print("✨ Features: Directory Navigation, Video Previews, System Info, File Management")
     print("=" * 80)
     
+    # Fork extra workers that bind the same port; the kernel balances accepts
+    if args.workers > 1 and hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT'):
+        FileServer.reuse_port = True
+        for _ in range(args.workers - 1):
+            if os.fork() == 0:
+                break
+    
+    # After the fork, so each worker has its own log listener thread
+    listener = configure_logging()
+    
     try:
-        # Use ThreadingHTTPServer for better concurrency
-        with ThreadingHTTPServer((bind_host, args.port), RemoteFileServerHandler) as httpd:
+        # Threaded server for concurrency within each worker process
+        handler = partial(RemoteFileServerHandler, directory=os.getcwd())
+        with FileServer((bind_host, args.port), handler) as httpd:
             httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except Exception as e:
         print(f"❌ Error starting server: {e}")
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()